@@ -1,83 +1,219 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
+import json
+import time
 import sys
 import os
 
 # Aapke existing modules import kar rahe hain
-from scrapers.google_maps import scrape_google_maps
-from scrapers.justdial import scrape_justdial
-from scrapers.instagram_finder import find_instagram
-from cleaner import clean_and_merge
+from scrapers.google_maps import MAPS_MODES, MAPS_BACKENDS
+from scrapers.justdial import JUSTDIAL_MODES
+from pipeline import stream_leads
+from utils.browser_pool import get_browser_pool
+from jobs import get_job_manager, JobQueueFull
+from scrape_cache import get_scrape_cache
+from utils.http_client import get_stats as get_http_stats
 # Note: exporter ki zaroorat nahi hai kyunki n8n data sambhal lega
 
 app = Flask(__name__)
 
+# Browser ek baar launch hota hai aur saari requests me reuse hota hai
+browser_pool = get_browser_pool()
+
+def parse_scrape_params(data):
+    # n8n ka JSON -> (params, error); /api/scrape aur /api/jobs dono yahi use karte hain
+    if not data:
+        return None, "No JSON data provided"
+
+    try:
+        limit = int(data.get('limit', 10)) # Default 10 agar n8n ne nahi bheja
+    except (TypeError, ValueError):
+        return None, "limit must be a number"
+
+    params = {
+        'keyword': data.get('keyword'),
+        'city': data.get('city'),
+        'limit': limit,
+        'skip_instagram': data.get('skip_instagram', False),
+        'mode': data.get('mode'), # detail / feed / list (None = config.yml)
+        'backend': data.get('backend'), # playwright / http (None = config.yml)
+        'justdial_mode': data.get('justdial_mode'), # http / browser (None = config.yml)
+        'skip_justdial': data.get('skip_justdial', False),
+        'refresh': data.get('refresh', False), # True = cached result nahi, naya scrape
+    }
+
+    # Validation
+    if not params['keyword'] or not params['city']:
+        return None, "Keyword and City are required"
+    if params['mode'] is not None and params['mode'] not in MAPS_MODES:
+        return None, f"mode must be one of: {', '.join(MAPS_MODES)}"
+    if params['backend'] is not None and params['backend'] not in MAPS_BACKENDS:
+        return None, f"backend must be one of: {', '.join(MAPS_BACKENDS)}"
+    if params['justdial_mode'] is not None and params['justdial_mode'] not in JUSTDIAL_MODES:
+        return None, f"justdial_mode must be one of: {', '.join(JUSTDIAL_MODES)}"
+    return params, None
+
+def run_scrape(params, cancel=None):
+    print(f"--- Processing: {params['keyword']} in {params['city']} (Limit: {params['limit']}) ---")
+
+    # Google Maps + JustDial ek saath (ek fail / timeout ho to doosre ke leads phir bhi),
+    # har lead scrape hote hi clean/dedupe aur (skip_instagram na ho to) website contacts + Instagram
+    source_stats = {}
+    leads = list(stream_leads(params['keyword'], params['city'], params['limit'], pool=browser_pool,
+                              maps_mode=params['mode'], maps_backend=params['backend'],
+                              justdial_mode=params['justdial_mode'], skip_justdial=params['skip_justdial'],
+                              skip_instagram=params['skip_instagram'], cancel=cancel, stats=source_stats))
+
+    return {
+        "status": "cancelled" if cancel is not None and cancel.is_set() else "success",
+        "total_leads": len(leads),
+        "sources": source_stats,
+        "data": leads
+    }
+
+def cached_scrape(params, cancel=None):
+    # Same keyword/city/modes ki requests ek hi scrape share karti hain, aur kuch der tak
+    # (scrape_cache.ttl) result reuse hota hai; chhota limit bade cached result se
+    scrape_cache = get_scrape_cache()
+    if scrape_cache is None:
+        return run_scrape(params, cancel)
+    return scrape_cache.get_or_run(params, run_scrape, cancel, refresh=params['refresh'])
+
+# Background jobs: request turant job_id leke lautti hai, scrape worker threads me
+job_manager = get_job_manager(cached_scrape)
+
 @app.route('/api/scrape', methods=['POST'])
 def scrape_leads():
     try:
         # 1. n8n se Data lena
-        data = request.json
-        if not data:
-            return jsonify({"error": "No JSON data provided"}), 400
+        params, error = parse_scrape_params(request.get_json(silent=True))
+        if error:
+            return jsonify({"error": error}), 400
 
-        keyword = data.get('keyword')
-        city = data.get('city')
-        limit = int(data.get('limit', 10)) # Default 10 agar n8n ne nahi bheja
-        skip_instagram = data.get('skip_instagram', False)
-
-        # Validation
-        if not keyword or not city:
-            return jsonify({"error": "Keyword and City are required"}), 400
-
-        print(f"--- Processing: {keyword} in {city} (Limit: {limit}) ---")
-
-        # 2. Google Maps Scraping
-        print("Starting Google Maps...")
-        google_maps_leads = scrape_google_maps(keyword, city, limit)
-        
-        # 3. JustDial Scraping
-        print("Starting JustDial...")
-        
-        justdial_leads =[] # scrape_justdial(keyword, city, limit)
-
-        # 4. Cleaning & Merging (Ye aapke cleaner.py se aa raha hai)
-        print("Merging Data...")
-        # Agar cleaner.py upload nahi kiya to simple merge kar raha hu (Safety ke liye)
-        try:
-            merged_leads = clean_and_merge(google_maps_leads, justdial_leads)
-        except NameError:
-            # Fallback agar cleaner.py nahi hai
-            merged_leads = google_maps_leads + justdial_leads
-
-        # 5. Instagram Finder (Optional)
-        if not skip_instagram and merged_leads:
-            print("Finding Instagram Profiles...")
-            for lead in merged_leads:
-                try:
-                    # Sirf tab dhundo agar website ya naam hai
-                    name = lead.get('name')
-                    website = lead.get('website')
-                    
-                    if name:
-                        instagram = find_instagram(name, website)
-                        lead['instagram'] = instagram # Result me add kar diya
-                    else:
-                        lead['instagram'] = None
-                        
-                except Exception as e:
-                    print(f"Error finding Insta for {lead.get('name')}: {e}")
-                    lead['instagram'] = None
-
-        # 6. Final Data Return (JSON format me)
-        return jsonify({
-            "status": "success",
-            "total_leads": len(merged_leads),
-            "data": merged_leads
-        })
+        # 2. Final Data Return (JSON format me)
+        return jsonify(cached_scrape(params))
 
     except Exception as e:
         print(f"ERROR: {e}")
         return jsonify({"status": "error", "message": str(e)}), 500
 
+STREAM_FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'sse': 'text/event-stream',
+}
+
+def stream_record(kind, payload, stream_format):
+    # NDJSON: har line ek JSON object ({"type": ...}); SSE: event name = type
+    if stream_format == 'sse':
+        return f"event: {kind}\ndata: {json.dumps(payload, default=str)}\n\n"
+    return json.dumps({"type": kind, **payload}, default=str) + "\n"
+
+@app.route('/api/scrape/stream', methods=['POST'])
+def scrape_leads_stream():
+    # /api/scrape jaisa hi, par har cleaned (aur enriched) lead tayyar hote hi bhej deta hai
+    # aur aakhir me ek summary record. Server poori list memory me nahi rakhta.
+    params, error = parse_scrape_params(request.get_json(silent=True))
+    if error:
+        return jsonify({"error": error}), 400
+
+    stream_format = (request.get_json(silent=True) or {}).get('format') or request.args.get('format')
+    if stream_format is None:
+        stream_format = 'sse' if request.accept_mimetypes.best == STREAM_FORMATS['sse'] else 'ndjson'
+    if stream_format not in STREAM_FORMATS:
+        return jsonify({"error": f"format must be one of: {', '.join(STREAM_FORMATS)}"}), 400
+
+    print(f"--- Streaming: {params['keyword']} in {params['city']} (Limit: {params['limit']}) ---")
+
+    scrape_cache = get_scrape_cache()
+    cached = scrape_cache.lookup(params) if scrape_cache is not None and not params['refresh'] else None
+
+    def generate():
+        started = time.monotonic()
+        if cached is not None:
+            for lead in cached['data']:
+                yield stream_record('lead', {"data": lead}, stream_format)
+            yield stream_record('summary', {
+                "status": "success",
+                "total_leads": cached['total_leads'],
+                "sources": cached['sources'],
+                "seconds": round(time.monotonic() - started, 1),
+                "cache": "hit"
+            }, stream_format)
+            return
+
+        source_stats = {}
+        total = 0
+        try:
+            for lead in stream_leads(params['keyword'], params['city'], params['limit'], pool=browser_pool,
+                                     maps_mode=params['mode'], maps_backend=params['backend'],
+                                     justdial_mode=params['justdial_mode'], skip_justdial=params['skip_justdial'],
+                                     skip_instagram=params['skip_instagram'], stats=source_stats):
+                total += 1
+                yield stream_record('lead', {"data": lead}, stream_format)
+        except Exception as e:
+            # Headers ja chuke hain, isliye error bhi stream me hi
+            print(f"ERROR: {e}")
+            yield stream_record('error', {"status": "error", "message": str(e)}, stream_format)
+            return
+
+        yield stream_record('summary', {
+            "status": "success",
+            "total_leads": total,
+            "sources": source_stats,
+            "seconds": round(time.monotonic() - started, 1),
+            "cache": "miss"
+        }, stream_format)
+
+    # Client beech me chala jaaye to generator close hota hai aur stream_leads ke stages band
+    return Response(generate(), mimetype=STREAM_FORMATS[stream_format],
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+@app.route('/api/jobs', methods=['POST'])
+def create_job():
+    params, error = parse_scrape_params(request.get_json(silent=True))
+    if error:
+        return jsonify({"error": error}), 400
+
+    try:
+        job = job_manager.submit(params)
+    except JobQueueFull as e:
+        return jsonify({"status": "error", "message": str(e)}), 429
+
+    print(f"--- Queued job {job['job_id']}: {params['keyword']} in {params['city']} ---")
+    return jsonify(job), 202
+
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def job_status(job_id):
+    job = job_manager.get(job_id)
+    if job is None:
+        return jsonify({"error": "Job not found (unknown id or result expired)"}), 404
+    return jsonify(job_manager.view(job))
+
+@app.route('/api/jobs/<job_id>/result', methods=['GET'])
+def job_result(job_id):
+    job = job_manager.get(job_id)
+    if job is None:
+        return jsonify({"error": "Job not found (unknown id or result expired)"}), 404
+    if job['status'] in ('queued', 'running'):
+        return jsonify(job_manager.view(job)), 202
+    if job['status'] == 'failed':
+        return jsonify({"status": "error", "message": job['error']}), 500
+    # Cancelled job: queue me hi cancel hua to result None, beech me hua to ab tak ke leads
+    return jsonify(job['result'] or {"status": "cancelled", "total_leads": 0, "sources": {}, "data": []})
+
+@app.route('/api/jobs/<job_id>', methods=['DELETE'])
+def cancel_job(job_id):
+    job = job_manager.cancel(job_id)
+    if job is None:
+        return jsonify({"error": "Job not found (unknown id or result expired)"}), 404
+    return jsonify(job_manager.view(job))
+
+@app.route('/api/health', methods=['GET'])
+def health():
+    scrape_cache = get_scrape_cache()
+    return jsonify({"status": "ok", "browser_pool": browser_pool.health(), "jobs": job_manager.health(),
+                    "scrape_cache": scrape_cache.health() if scrape_cache is not None else None,
+                    "http": get_http_stats()})
+
 if __name__ == '__main__':
     # Server start karo
     print("Server starting on port 5000...")
@@ -0,0 +1,50 @@
+# Har HTTP request par config ka kharcha: user-011 se pehle get_random_user_agent /
+# get_max_retries har call par config.yml kholte aur yaml parse karte the, ab get_config()
+# parsed object deta hai (mtime check RELOAD_CHECK_INTERVAL me ek baar).
+#   python -m benchmarks.config_overhead [--calls 2000]
+import argparse
+import random
+import time
+import yaml
+from utils.config import get_config
+from utils.proxies import get_random_user_agent
+from utils.retryer import get_max_retries
+
+def baseline_load_config():
+    # utils/proxies.py aur utils/retryer.py ka purana load_config
+    try:
+        with open('config.yml', 'r') as f:
+            return yaml.safe_load(f)
+    except Exception:
+        return {}
+
+def baseline_request_overhead():
+    # Ek request: user agent + retry count, dono ka apna file read + parse
+    config = baseline_load_config()
+    random.choice(config.get('user_agents', ['-']))
+    return baseline_load_config().get('scraping', {}).get('max_retries', 3)
+
+def request_overhead():
+    get_random_user_agent()
+    return get_max_retries()
+
+def per_call(fn, calls):
+    started = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - started) / calls
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark per-request config overhead')
+    parser.add_argument('--calls', type=int, default=2000)
+    args = parser.parse_args()
+
+    get_config()
+    baseline = per_call(baseline_request_overhead, args.calls)
+    cached = per_call(request_overhead, args.calls * 50)
+    print(f"per request (user agent + max retries), {args.calls} calls:")
+    print(f"  yaml load per call   {baseline * 1e6:9.1f} us")
+    print(f"  get_config()         {cached * 1e6:9.2f} us ({baseline / cached:.0f}x less)")
+
+if __name__ == '__main__':
+    main()
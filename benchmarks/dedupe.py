@@ -0,0 +1,88 @@
+# Dedupe benchmark: user-008 se pehle wala pairwise fuzz.ratio loop vs cleaner.dedupe
+# (chunked rapidfuzz cdist). Dono ke kept leads same hone chahiye.
+#   python -m benchmarks.dedupe [--sizes 1000 10000 100000] [--baseline-max 10000]
+import argparse
+import random
+import time
+from rapidfuzz import fuzz
+from cleaner import dedupe
+from utils.logger import logger
+
+WORDS = ['smile', 'pearl', 'city', 'care', 'apex', 'sai', 'shree', 'modern', 'royal', 'bright', 'family',
+         'green', 'lotus', 'metro', 'sunrise', 'galaxy', 'prime', 'unity', 'crystal', 'orchid', 'vedant']
+KINDS = ['dental clinic', 'dental care', 'multispeciality dental', 'orthodontic centre', 'dentistry', 'tooth studio']
+AREAS = ['andheri', 'bandra', 'thane', 'borivali', 'powai', 'kothrud', 'baner', 'wakad', 'dadar', 'vashi']
+
+def baseline_dedupe(leads, similarity_threshold=85):
+    # cleaner.dedupe jaisa user-008 se pehle tha
+    unique_leads = []
+    seen_phones = set()
+    seen_names = []
+    for lead in leads:
+        phone = lead.get('phone')
+        name = lead.get('name', '').strip()
+        if not name:
+            continue
+        is_duplicate = bool(phone and phone in seen_phones)
+        if not is_duplicate:
+            for seen_name in seen_names:
+                if fuzz.ratio(name.lower(), seen_name.lower()) >= similarity_threshold:
+                    is_duplicate = True
+                    break
+        if not is_duplicate:
+            unique_leads.append(lead)
+            if phone:
+                seen_phones.add(phone)
+            seen_names.append(name)
+    return unique_leads
+
+def typo(name, rng):
+    idx = rng.randrange(len(name))
+    return name[:idx] + rng.choice('aeiourst') + name[idx + 1:]
+
+def sample_leads(count, seed=11):
+    # Maps + JustDial jaisa mix: ~40% leads pehle wale ka duplicate (same phone, case ya typo)
+    rng = random.Random(seed)
+    leads = []
+    for idx in range(count):
+        if leads and rng.random() < 0.4:
+            original = rng.choice(leads)
+            variant = rng.choice([
+                lambda: {'name': original['name'].upper(), 'phone': None},
+                lambda: {'name': typo(original['name'], rng), 'phone': None},
+                lambda: {'name': f"{rng.choice(WORDS).title()} Clinic {idx}", 'phone': original['phone']},
+            ])()
+            leads.append(variant)
+            continue
+        name = f"{rng.choice(WORDS).title()} {rng.choice(WORDS).title()} {rng.choice(KINDS).title()} {rng.choice(AREAS).title()} {idx}"
+        leads.append({'name': name, 'phone': f"+9198{rng.randrange(10 ** 7, 10 ** 8)}" if rng.random() < 0.8 else None})
+    return leads
+
+def timed(fn, *args):
+    started = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - started
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark cleaner.dedupe against the pairwise fuzz.ratio loop')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--baseline-max', type=int, default=10000,
+                        help='run the pairwise loop only up to this size (it is quadratic in Python)')
+    args = parser.parse_args()
+    logger.disabled = True
+
+    for size in args.sizes:
+        leads = sample_leads(size)
+        kept, seconds = timed(dedupe, leads)
+        line = f"{size:>7} leads: dedupe {seconds:7.2f}s, {len(kept)} kept"
+        if size <= args.baseline_max:
+            baseline_kept, baseline_seconds = timed(baseline_dedupe, leads)
+            assert [id(lead) for lead in kept] == [id(lead) for lead in baseline_kept], \
+                f"dedupe kept different leads than the pairwise loop at {size}"
+            line += f" | pairwise loop {baseline_seconds:7.2f}s, identical ({baseline_seconds / seconds:.1f}x)"
+        else:
+            line += " | pairwise loop skipped (--baseline-max)"
+        print(line)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+# JustDial search page parse: user-018 se pehle poori page html.parser se parse hoti thi
+# aur har listing par har field ke liye alag regex find(). Ab find_listings sirf cards ka
+# tree banata hai (lxml ho to usse) aur extract_justdial_lead ek pass me fields nikalta hai.
+# Page tests/fixtures/justdial_search_large.html hai. Dono ke leads same hone chahiye.
+#   python -m benchmarks.justdial_parser [--pages 20]
+import argparse
+import os
+import re
+import time
+from bs4 import BeautifulSoup
+from scrapers import justdial_parser
+from scrapers.justdial_parser import find_listings, extract_justdial_lead
+
+FIXTURE = os.path.join(os.path.dirname(__file__), '..', 'tests', 'fixtures', 'justdial_search_large.html')
+
+def baseline_extract_justdial_lead(listing):
+    # scrapers/justdial.py ka extract_justdial_lead jaisa user-018 se pehle tha
+    lead = {'name': None, 'phone': None, 'website': None, 'address': None, 'maps_url': None, 'source': 'JustDial'}
+
+    name_elem = listing.find(['h2', 'h3', 'span', 'a'], class_=re.compile(r'.*name.*|.*title.*|.*business.*', re.I))
+    if name_elem:
+        lead['name'] = name_elem.get_text(strip=True)
+
+    phone_elem = listing.find(['span', 'a', 'p'], class_=re.compile(r'.*phone.*|.*mobile.*|.*contact.*', re.I))
+    if phone_elem:
+        phone_match = re.search(r'[\d\s\-\+\(\)]{10,}', phone_elem.get_text(strip=True))
+        if phone_match:
+            lead['phone'] = phone_match.group().strip()
+    if not lead['phone']:
+        phone_link = listing.find('a', href=re.compile(r'^tel:'))
+        if phone_link:
+            lead['phone'] = phone_link['href'].replace('tel:', '').strip()
+
+    address_elem = listing.find(['span', 'p', 'div'], class_=re.compile(r'.*address.*|.*location.*', re.I))
+    if address_elem:
+        lead['address'] = address_elem.get_text(strip=True)
+
+    website_elem = listing.find('a', class_=re.compile(r'.*website.*|.*web.*', re.I))
+    if website_elem and website_elem.get('href'):
+        lead['website'] = website_elem['href']
+
+    return lead if lead.get('name') else None
+
+def baseline_parse(html):
+    soup = BeautifulSoup(html, 'html.parser')
+    listings = soup.find_all(['li', 'div'], class_=re.compile(r'.*result.*|.*listing.*|.*card.*', re.I))
+    return [baseline_extract_justdial_lead(listing) for listing in listings]
+
+def parse(html):
+    return [extract_justdial_lead(listing) for listing in find_listings(html)]
+
+def pages_per_second(fn, html, pages):
+    started = time.perf_counter()
+    for _ in range(pages):
+        fn(html)
+    return pages / (time.perf_counter() - started)
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark JustDial search page parsing')
+    parser.add_argument('--pages', type=int, default=20)
+    args = parser.parse_args()
+
+    with open(FIXTURE, encoding='utf-8') as f:
+        html = f.read()
+
+    expected = baseline_parse(html)
+    print(f"{len(html) / 1024:.0f} KB page, {len(expected)} listings, "
+          f"{sum(1 for lead in expected if lead)} leads, {args.pages} pages:")
+    print(f"  full parse + per-field find (html.parser)   {pages_per_second(baseline_parse, html, args.pages):7.1f} pages/s")
+
+    backends = ['html.parser']
+    if justdial_parser.HTML_PARSER != 'html.parser':
+        backends.append(justdial_parser.HTML_PARSER)
+    default_backend = justdial_parser.HTML_PARSER
+    try:
+        for backend in backends:
+            justdial_parser.HTML_PARSER = backend
+            assert parse(html) == expected, f"leads differ from the baseline parser ({backend})"
+            label = f"scoped parse + one pass ({backend})"
+            print(f"  {label:<43} {pages_per_second(parse, html, args.pages):7.1f} pages/s")
+    finally:
+        justdial_parser.HTML_PARSER = default_backend
+    if len(backends) == 1:
+        print("  (lxml not installed; pip install -r requirements.txt for the lxml numbers)")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+# Phone normalization micro-benchmark: purana (har call par parse) vs cached + Indian fast
+# path wala normalize_phones. Output dono ka same hona chahiye.
+#   python -m benchmarks.phone_normalization [--count 20000] [--distinct 2000]
+import argparse
+import random
+import re
+import time
+import phonenumbers
+from cleaner import normalize_phone, normalize_phones, is_valid_indian_number
+
+def baseline_normalize_phone(phone_str, default_region='IN'):
+    # cleaner.normalize_phone jaisa user-010 se pehle tha (bina cache / fast path)
+    if not phone_str:
+        return None
+    try:
+        phone_str = str(phone_str).strip()
+        phone_str = re.sub(r'[^\d\+]', '', phone_str)
+        if not phone_str:
+            return None
+        parsed = phonenumbers.parse(phone_str, default_region)
+        if phonenumbers.is_valid_number(parsed):
+            return phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164)
+    except Exception:
+        pass
+    return phone_str if phone_str else None
+
+def sample_phones(count, distinct, seed=7):
+    # Scrapers jaise shapes: mobile, +91 / 0 prefix, landline, spaces/dashes, foreign, kachra
+    rng = random.Random(seed)
+    shapes = [
+        lambda: f"{rng.choice('6789')}{rng.randrange(10 ** 8, 10 ** 9)}",
+        lambda: f"+91 {rng.choice('6789')}{rng.randrange(1000, 9999)} {rng.randrange(10000, 99999)}",
+        lambda: f"0{rng.choice('6789')}{rng.randrange(10 ** 8, 10 ** 9)}",
+        lambda: f"022-{rng.randrange(2000, 9999)}{rng.randrange(1000, 9999)}",
+        lambda: f"0{rng.choice(['11', '20', '79', '80'])} {rng.randrange(2000, 9999)} {rng.randrange(1000, 9999)}",
+        lambda: f"+1 415 {rng.randrange(200, 999)} {rng.randrange(1000, 9999)}",
+        lambda: f"{rng.randrange(10000, 99999)}",
+        lambda: rng.choice(['', None, 'N/A', 'Call now']),
+    ]
+    pool = [rng.choice(shapes)() for _ in range(distinct)]
+    return [rng.choice(pool) for _ in range(count)]
+
+def timed(fn, *args):
+    started = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - started
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark cleaner.normalize_phones against the uncached parser')
+    parser.add_argument('--count', type=int, default=20000, help='phones per run')
+    parser.add_argument('--distinct', type=int, default=2000, help='distinct numbers among them (repeats hit the cache)')
+    args = parser.parse_args()
+
+    phones = sample_phones(args.count, args.distinct)
+
+    baseline, baseline_seconds = timed(lambda values: [baseline_normalize_phone(phone) for phone in values], phones)
+    normalize_phone.cache_clear()
+    is_valid_indian_number.cache_clear()
+    cold, cold_seconds = timed(normalize_phones, phones)
+    warm, warm_seconds = timed(normalize_phones, phones)
+
+    assert cold == baseline and warm == baseline, "normalize_phones output differs from the baseline parser"
+    print(f"{args.count} phones ({args.distinct} distinct), identical output")
+    print(f"  baseline parse      {baseline_seconds:.3f}s")
+    print(f"  normalize_phones    {cold_seconds:.3f}s cold cache ({baseline_seconds / cold_seconds:.1f}x), "
+          f"{warm_seconds:.3f}s warm ({baseline_seconds / warm_seconds:.1f}x)")
+
+    # Sirf distinct numbers: cache ka fayda nahi, sirf fast path ka
+    unique = list(dict.fromkeys(phones))
+    baseline_unique, baseline_unique_seconds = timed(lambda values: [baseline_normalize_phone(phone) for phone in values], unique)
+    normalize_phone.cache_clear()
+    is_valid_indian_number.cache_clear()
+    fast_unique, fast_unique_seconds = timed(normalize_phones, unique)
+    assert fast_unique == baseline_unique
+    print(f"  {len(unique)} distinct only: baseline {baseline_unique_seconds:.3f}s, "
+          f"fast path {fast_unique_seconds:.3f}s ({baseline_unique_seconds / fast_unique_seconds:.1f}x)")
+
+if __name__ == '__main__':
+    main()
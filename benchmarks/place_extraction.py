@@ -0,0 +1,91 @@
+# Maps place page se fields nikalna: user-004 se pehle har field ke liye alag locator
+# calls (count + inner_text/get_attribute, har ek browser ka round trip) hoti thi, ab
+# PLACE_FIELDS ke saath ek hi page.evaluate. Page route.fulfill se saved HTML
+# (tests/fixtures/maps_place_dom.html) se aata hai, network nahi lagta.
+#   python -m benchmarks.place_extraction [--pages 30]
+import argparse
+import asyncio
+import os
+import time
+from playwright.async_api import async_playwright
+from scrapers.google_maps import PLACE_FIELDS, EXTRACT_PLACE_JS
+
+FIXTURE = os.path.join(os.path.dirname(__file__), '..', 'tests', 'fixtures', 'maps_place_dom.html')
+PLACE_URL = 'https://www.google.com/maps/place/Smile+Dental+Clinic/data=!4m7!3m6!1s0x3be7c9b:0x1a2b3c!8m2!3d19.1363!4d72.8277'
+
+async def baseline_extract(page):
+    # Purana extract_place_details wala tareeka, ab ke saare PLACE_FIELDS par
+    out = {'url': page.url}
+    for key, spec in PLACE_FIELDS.items():
+        locator = page.locator(spec['selector'])
+        value = None
+        if await locator.count() > 0:
+            if spec.get('attr'):
+                value = await locator.first.get_attribute(spec['attr'])
+            else:
+                value = await locator.first.inner_text()
+        if value and spec.get('strip'):
+            value = value.replace(spec['strip'], '')
+        out[key] = value.strip() if value else None
+    return out
+
+async def evaluate_extract(page):
+    return await page.evaluate(EXTRACT_PLACE_JS, PLACE_FIELDS)
+
+async def load_place(page):
+    await page.goto(PLACE_URL, wait_until="domcontentloaded", timeout=30000)
+    await page.wait_for_selector('h1', timeout=10000)
+
+async def timed_pages(page, extract, pages):
+    started = time.perf_counter()
+    for _ in range(pages):
+        await load_place(page)
+        await extract(page)
+    return time.perf_counter() - started
+
+async def timed_extract(page, extract, calls):
+    started = time.perf_counter()
+    for _ in range(calls):
+        await extract(page)
+    return (time.perf_counter() - started) / calls
+
+async def run(pages):
+    with open(FIXTURE, encoding='utf-8') as f:
+        html = f.read()
+
+    async with async_playwright() as p:
+        try:
+            browser = await p.chromium.launch(headless=True)
+        except Exception as e:
+            print(f"Chromium not available ({str(e).splitlines()[0]}); run `playwright install chromium` first.")
+            return
+        try:
+            context = await browser.new_context()
+            await context.route('**/maps/place/**', lambda route: route.fulfill(content_type='text/html', body=html))
+            page = await context.new_page()
+
+            await load_place(page)
+            expected = await baseline_extract(page)
+            assert await evaluate_extract(page) == expected, "single evaluate differs from per-locator output"
+
+            # Har tareeka do baar, kam wala time (pehla run warm-up ka kaam karta hai)
+            base_pages = min([await timed_pages(page, baseline_extract, pages) for _ in range(2)])
+            eval_pages = min([await timed_pages(page, evaluate_extract, pages) for _ in range(2)])
+            base_call = await timed_extract(page, baseline_extract, pages * 5)
+            eval_call = await timed_extract(page, evaluate_extract, pages * 5)
+        finally:
+            await browser.close()
+
+    print(f"{len(PLACE_FIELDS)} fields, {len(html) / 1024:.0f} KB place page, {pages} pages:")
+    print(f"  per-locator calls    {pages / base_pages:7.1f} pages/s   {base_call * 1000:6.2f} ms/extract")
+    print(f"  single evaluate      {pages / eval_pages:7.1f} pages/s   {eval_call * 1000:6.2f} ms/extract "
+          f"({base_call / eval_call:.1f}x)")
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark Maps place page field extraction')
+    parser.add_argument('--pages', type=int, default=30)
+    args = parser.parse_args()
+    asyncio.run(run(args.pages))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+# Website se Instagram/contacts: user-016 se pehle poori body BeautifulSoup se parse hoti
+# thi, ab InstagramScanner/ContactScanner 64 KB chunks aate hi byte regexes chalate hain
+# aur sab mil jaye to download rok dete hain. Page tests/fixtures/website_large.html
+# (~2.4 MB); social links header ya footer marker par daal ke variants bante hain.
+#   python -m benchmarks.website_scan [--repeat 3]
+import argparse
+import os
+import re
+import time
+from bs4 import BeautifulSoup
+from scrapers.instagram_finder import InstagramScanner, clean_instagram_url
+from scrapers.website_contacts import ContactScanner
+
+FIXTURE = os.path.join(os.path.dirname(__file__), '..', 'tests', 'fixtures', 'website_large.html')
+CHUNK_SIZE = 64 * 1024  # read_body ka iter_content size
+SOCIAL_LINKS = (
+    '<a href="https://www.instagram.com/smiledental_mumbai/">Instagram</a>'
+    '<a href="https://www.facebook.com/smiledentalmumbai">Facebook</a>'
+    '<a href="https://www.linkedin.com/company/smile-dental/">LinkedIn</a>'
+    '<a href="https://wa.me/919820012345">WhatsApp</a>'
+    '<a href="mailto:info@smiledental.in">info@smiledental.in</a>'
+)
+ENCODED_LINK = '<a href="https://www.instagram.com&#x2F;smiledental_mumbai/">Instagram</a>'
+
+def baseline_extract_instagram(text):
+    # lookup_website_instagram ka parse jaisa user-016 se pehle tha
+    soup = BeautifulSoup(text, 'html.parser')
+    for link in soup.find_all('a', href=re.compile(r'instagram\.com/[^/]+/?$')):
+        href = link.get('href')
+        if href and 'instagram.com/' in href:
+            instagram_url = clean_instagram_url(href)
+            if instagram_url:
+                return instagram_url
+    instagram_match = re.search(r'instagram\.com/([a-zA-Z0-9._]+)/?', text)
+    if instagram_match and instagram_match.group(1) not in ['share', 'p', 'reel', 'tv', 'explore', 'accounts']:
+        return f"https://www.instagram.com/{instagram_match.group(1)}/"
+    return None
+
+def stream(scanner, body):
+    # fetch(on_chunk=...) ki tarah; scanner True de to baaki body nahi aati
+    read = 0
+    for start in range(0, len(body), CHUNK_SIZE):
+        chunk = body[start:start + CHUNK_SIZE]
+        read += len(chunk)
+        if scanner.feed(chunk):
+            break
+    return scanner.finish(body[:read]), read
+
+def scan_instagram(body):
+    return stream(InstagramScanner(), body)
+
+def scan_contacts(body):
+    contacts, read = stream(ContactScanner(), body)
+    return contacts['instagram'], read
+
+def build_variants(html):
+    return {
+        'link in header': html.replace('<!--header-social-->', SOCIAL_LINKS),
+        'link in footer': html.replace('<!--footer-social-->', SOCIAL_LINKS),
+        'no Instagram': html,
+        'entity-encoded href': html.replace('<!--footer-social-->', ENCODED_LINK),
+    }
+
+def best_of(fn, arg, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn(arg)
+        timings.append(time.perf_counter() - started)
+    return min(timings), result
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark website Instagram/contact scanning')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    with open(FIXTURE, encoding='utf-8') as f:
+        html = f.read()
+
+    print(f"{len(html.encode()) / 1e6:.1f} MB page, {CHUNK_SIZE // 1024} KB chunks, best of {args.repeat}:")
+    print(f"  {'variant':<22}{'BeautifulSoup':>14}{'InstagramScanner':>24}{'ContactScanner':>24}")
+    for label, text in build_variants(html).items():
+        body = text.encode()
+        base_time, expected = best_of(baseline_extract_instagram, text, args.repeat)
+        cells = []
+        for scan in (scan_instagram, scan_contacts):
+            scan_time, (instagram_url, read) = best_of(scan, body, args.repeat)
+            assert instagram_url == expected, f"{label}: {scan.__name__} found {instagram_url}, baseline {expected}"
+            cells.append(f"{scan_time * 1000:8.1f} ms ({read / len(body):4.0%} read)")
+        print(f"  {label:<22}{base_time * 1000:11.0f} ms" + ''.join(f"{cell:>24}" for cell in cells))
+
+if __name__ == '__main__':
+    main()
@@ -1,19 +1,35 @@
+import functools
 import phonenumbers
-from rapidfuzz import fuzz
+import numpy as np
+from urllib.parse import urlparse
+from rapidfuzz import fuzz, process
 from utils.logger import logger
 import re
 
+DEDUPE_CHUNK_SIZE = 256
+
+PHONE_CACHE_SIZE = 65536
+PHONE_STRIP_RE = re.compile(r'[^\d\+]')
+INDIAN_PHONE_RE = re.compile(r'(?:\+91|0)?([1-9]\d{9})')
+
+@functools.lru_cache(maxsize=PHONE_CACHE_SIZE)
 def normalize_phone(phone_str, default_region='IN'):
     if not phone_str:
         return None
     
     try:
         phone_str = str(phone_str).strip()
-        phone_str = re.sub(r'[^\d\+]', '', phone_str)
+        phone_str = PHONE_STRIP_RE.sub('', phone_str)
         
         if not phone_str:
             return None
         
+        # Zyadatar numbers 10 digit Indian mobile/landline hote hain, unke liye full parse nahi
+        if default_region == 'IN':
+            fast_phone = normalize_indian_phone(phone_str)
+            if fast_phone:
+                return fast_phone
+        
         parsed = phonenumbers.parse(phone_str, default_region)
         
         if phonenumbers.is_valid_number(parsed):
@@ -23,74 +39,162 @@ def normalize_phone(phone_str, default_region='IN'):
     
     return phone_str if phone_str else None
 
-def dedupe(leads, similarity_threshold=85):
-    logger.info(f"Deduplicating {len(leads)} leads...")
-    
-    if not leads:
-        return []
-    
-    unique_leads = []
-    seen_phones = set()
-    seen_names = []
-    
-    for lead in leads:
-        phone = lead.get('phone')
-        name = lead.get('name', '').strip()
-        
-        if not name:
-            continue
-        
-        is_duplicate = False
+def normalize_indian_phone(digits):
+    # '+91XXXXXXXXXX', '0XXXXXXXXXX' ya 'XXXXXXXXXX' -> E164. Validity phonenumbers se hi
+    # check hoti hai (same metadata), sirf string parsing skip hoti hai. Invalid par None,
+    # taaki caller normal parse path le.
+    match = INDIAN_PHONE_RE.fullmatch(digits)
+    if match and is_valid_indian_number(match.group(1)):
+        return '+91' + match.group(1)
+    return None
+
+@functools.lru_cache(maxsize=PHONE_CACHE_SIZE)
+def is_valid_indian_number(national_number):
+    number = phonenumbers.PhoneNumber(country_code=91, national_number=int(national_number))
+    return phonenumbers.is_valid_number(number)
+
+def normalize_phones(phones, default_region='IN'):
+    # Batch API: cleaner har batch ke phones ek saath isse normalize karta hai
+    return [normalize_phone(phone, default_region) for phone in phones]
+
+def normalize_name(name):
+    return name.lower()
+
+def website_domain(url):
+    if not url:
+        return None
+    netloc = urlparse(url if '//' in url else f'//{url}').netloc.lower()
+    return netloc[4:] if netloc.startswith('www.') else netloc or None
+
+# Dedupe rules: same phone, ya pehle rakhe kisi name se fuzz.ratio >= threshold. State
+# batches ke beech rehta hai, isliye streaming pipeline jitne leads ek saath tayyar hon
+# utne ek batch me bhejti hai (consumer tez ho to 1, enrichment ke peeche queue bhari
+# ho to bade batch, jahan cdist kaam aata hai).
+class LeadDeduper:
+    def __init__(self, similarity_threshold=85):
+        self.similarity_threshold = similarity_threshold
+        self.seen_phones = set()
+        self.seen_names = []
+        self.duplicates = 0
+
+    def add_batch(self, leads):
+        # Names ek hi baar normalize
+        prepared = []
+        for lead in leads:
+            name = (lead.get('name') or '').strip()
+            if name:
+                prepared.append((lead, lead.get('phone'), normalize_name(name)))
         
-        if phone and phone in seen_phones:
-            is_duplicate = True
+        unique_leads = []
         
-        if not is_duplicate:
-            for seen_name in seen_names:
-                similarity = fuzz.ratio(name.lower(), seen_name.lower())
-                if similarity >= similarity_threshold:
-                    is_duplicate = True
-                    break
+        # Chunk ke saare names ek saath score hote hain (rapidfuzz cdist, C me, saare cores):
+        # pehle rakhe gaye names ke against, aur chunk ke andar aapas me. Phir order me
+        # accept/reject, isliye result wahi hai jo har name ko ek ek karke compare karne se aata.
+        for start in range(0, len(prepared), DEDUPE_CHUNK_SIZE):
+            chunk = prepared[start:start + DEDUPE_CHUNK_SIZE]
+            names = [normalized for _, _, normalized in chunk]
+            
+            matches_seen = None
+            if self.seen_names:
+                matches_seen = self.matches_seen(names)
+            matches_chunk = similarity_matrix(names, names, self.similarity_threshold) if len(chunk) > 1 else None
+            
+            accepted = []
+            for idx, (lead, phone, normalized) in enumerate(chunk):
+                if phone and phone in self.seen_phones:
+                    continue
+                if matches_seen is not None and matches_seen[idx]:
+                    continue
+                if accepted and matches_chunk[idx, accepted].any():
+                    continue
+                
+                accepted.append(idx)
+                unique_leads.append(lead)
+                if phone:
+                    self.seen_phones.add(phone)
+            
+            self.seen_names.extend(names[idx] for idx in accepted)
         
-        if not is_duplicate:
-            unique_leads.append(lead)
-            if phone:
-                seen_phones.add(phone)
-            seen_names.append(name)
-    
+        self.duplicates += len(leads) - len(unique_leads)
+        return unique_leads
+
+    def matches_seen(self, names):
+        # Akele name ke liye cdist ka thread setup mehenga padta hai, extractOne wahi scorer hai
+        if len(names) == 1:
+            return [process.extractOne(names[0], self.seen_names, scorer=fuzz.ratio,
+                                       score_cutoff=self.similarity_threshold) is not None]
+        return similarity_matrix(names, self.seen_names, self.similarity_threshold).any(axis=1)
+
+def dedupe(leads, similarity_threshold=85):
+    # Poori list ek saath (batch runs / benchmarks); streaming pipeline LeadDeduper seedha use karti hai
+    logger.info(f"Deduplicating {len(leads)} leads...")
+    unique_leads = LeadDeduper(similarity_threshold).add_batch(leads)
     logger.info(f"Removed {len(leads) - len(unique_leads)} duplicates. {len(unique_leads)} unique leads remain")
     return unique_leads
 
-def clean_and_merge(google_maps_leads, justdial_leads):
+def similarity_matrix(names, choices, similarity_threshold):
+    scores = process.cdist(names, choices, scorer=fuzz.ratio, score_cutoff=similarity_threshold,
+                           dtype=np.float32, workers=-1)
+    return scores >= similarity_threshold
+
+def clean_and_merge(google_maps_leads, justdial_leads, index=None):
+    # Batch API: poori lists ek saath (clean_stream iska streaming roop hai)
     logger.info("Cleaning and merging leads...")
     
-    all_leads = []
-    
-    for lead in google_maps_leads:
-        cleaned_lead = clean_lead(lead)
-        if cleaned_lead:
-            all_leads.append(cleaned_lead)
+    raw_leads = [lead for lead in list(google_maps_leads) + list(justdial_leads) if lead and lead.get('name')]
+    phones = normalize_phones([lead.get('phone') for lead in raw_leads])
     
-    for lead in justdial_leads:
-        cleaned_lead = clean_lead(lead)
-        if cleaned_lead:
-            all_leads.append(cleaned_lead)
+    all_leads = [lead for lead in map(clean_lead, raw_leads, phones) if lead]
     
     logger.info(f"Total leads before deduplication: {len(all_leads)}")
     
     unique_leads = dedupe(all_leads)
     
+    # Pichle runs ke against check (lead_index.LeadIndex), har lead par 'is_new' lag jaata hai
+    if index is not None:
+        index.mark(unique_leads)
+    
     return unique_leads
 
-def clean_lead(lead):
+def clean_stream(batches, index=None):
+    # Har batch (pipeline.stream_sources(batches=True) se) clean + dedupe hote hi aage.
+    # Sources interleave hote hain, isliye duplicate me kaun sa rakha gaya wo arrival
+    # order se tay hota hai
+    deduper = LeadDeduper()
+    new_count = 0
+    for batch in batches:
+        named = [lead for lead in batch if lead and lead.get('name')]
+        phones = normalize_phones([lead.get('phone') for lead in named])
+        cleaned = [lead for lead in map(clean_lead, named, phones) if lead]
+        unique_leads = deduper.add_batch(cleaned)
+        deduper.duplicates += len(batch) - len(cleaned)
+        if not unique_leads:
+            continue
+        # Pichle runs ke against check (lead_index.LeadIndex), har lead par 'is_new' lag jaata hai.
+        # Naye leads index me tab jaate hain jab caller unhe export kar de (LeadIndex.remember)
+        if index is not None:
+            index.mark(unique_leads, log=False, add=False)
+            new_count += sum(1 for lead in unique_leads if lead['is_new'])
+        yield from unique_leads
+    
+    logger.info(f"Removed {deduper.duplicates} duplicates. {len(deduper.seen_names)} unique leads")
+    if index is not None:
+        logger.info(f"Lead index: {new_count} new, {len(deduper.seen_names) - new_count} already known")
+
+def clean_lead(lead, phone=None):
+    # phone: normalize_phones se pehle se normalize kiya hua (na ho to yahin)
     if not lead or not lead.get('name'):
         return None
     
     cleaned = {
         'name': lead.get('name', '').strip(),
-        'phone': normalize_phone(lead.get('phone')),
+        'phone': phone if phone is not None else normalize_phone(lead.get('phone')),
         'website': clean_url(lead.get('website')),
         'address': lead.get('address', '').strip() if lead.get('address') else None,
+        'rating': lead.get('rating'),
+        'category': lead.get('category'),
+        'latitude': lead.get('latitude'),
+        'longitude': lead.get('longitude'),
         'maps_url': clean_url(lead.get('maps_url')),
         'instagram': clean_url(lead.get('instagram')),
         'source': lead.get('source', 'Unknown')
@@ -3,11 +3,15 @@
 import argparse
 import sys
 from utils.logger import logger
-from scrapers.google_maps import scrape_google_maps
-from scrapers.justdial import scrape_justdial
-from scrapers.instagram_finder import find_instagram
-from cleaner import clean_and_merge
-from exporter import export_leads
+from scrapers.google_maps import MAPS_MODES, MAPS_BACKENDS
+from scrapers.justdial import JUSTDIAL_MODES
+from pipeline import stream_sources, SOURCE_LABELS
+from cleaner import clean_stream
+from exporter import LeadWriter
+from lead_index import LeadIndex
+from enricher import enrich_stream
+from utils.http_cache import set_cache_mode
+from utils.http_client import get_stats as get_http_stats
 
 def main():
     parser = argparse.ArgumentParser(
@@ -18,6 +22,7 @@ Examples:
   python cli.py --keyword "IT company" --city "Mehsana"
   python cli.py --keyword "restaurant" --city "Mumbai" --limit 100
   python cli.py -k "coffee shop" -c "Delhi" -l 30
+  python cli.py -k "dentist" -c "Mumbai" -l 200 --mode list
         '''
     )
     
@@ -42,14 +47,66 @@ Examples:
         help='Maximum number of leads to scrape (default: 50)'
     )
     
+    parser.add_argument(
+        '--mode',
+        choices=MAPS_MODES,
+        default=None,
+        help='Google Maps mode: detail (open every place), feed (use search payload), '
+             'list (cards only, fastest) (default: from config.yml)'
+    )
+    
+    parser.add_argument(
+        '--backend',
+        choices=MAPS_BACKENDS,
+        default=None,
+        help='How place pages are fetched: playwright or http (browserless) (default: from config.yml)'
+    )
+    
+    parser.add_argument(
+        '--justdial-mode',
+        choices=JUSTDIAL_MODES,
+        default=None,
+        help='JustDial mode: http (search result pages) or browser (scroll the listing page in headless Chromium) '
+             '(default: from config.yml)'
+    )
+    
     parser.add_argument(
         '--skip-instagram',
         action='store_true',
-        help='Skip Instagram profile search'
+        help='Skip website contacts and Instagram profile search'
+    )
+    
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Only enrich and export leads not seen in previous runs (uses the lead index in db/)'
+    )
+    
+    parser.add_argument(
+        '--compact-index',
+        action='store_true',
+        help='Drop lead index entries older than lead_index.max_age_days and compact the file'
+    )
+    
+    cache_group = parser.add_mutually_exclusive_group()
+    cache_group.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Do not read or write the HTTP response and Instagram result caches in db/'
+    )
+    cache_group.add_argument(
+        '--refresh',
+        action='store_true',
+        help='Fetch everything from the network again and update the caches'
     )
     
     args = parser.parse_args()
     
+    if args.no_cache:
+        set_cache_mode('off')
+    elif args.refresh:
+        set_cache_mode('refresh')
+    
     logger.info("=" * 60)
     logger.info("LEAD GENERATOR STARTED")
     logger.info("=" * 60)
@@ -59,42 +116,60 @@ Examples:
     logger.info("=" * 60)
     
     try:
-        logger.info("\n[1/5] Scraping Google Maps...")
-        google_maps_leads = scrape_google_maps(args.keyword, args.city, args.limit)
-        logger.info(f"✓ Google Maps: {len(google_maps_leads)} leads found")
+        # Saare steps ek saath chalte hain: har lead scrape hote hi clean, enrich aur
+        # file me likhi jaati hai, poore source ke khatam hone ka wait nahi
+        logger.info("\n[1/4] Scraping Google Maps and JustDial in parallel...")
+        source_stats = {}
+        sources = stream_sources(args.keyword, args.city, args.limit, maps_mode=args.mode, maps_backend=args.backend,
+                                 justdial_mode=args.justdial_mode, stats=source_stats, batches=True)
         
-        logger.info("\n[2/5] Scraping JustDial...")
-        justdial_leads = scrape_justdial(args.keyword, args.city, args.limit)
-        logger.info(f"✓ JustDial: {len(justdial_leads)} leads found")
+        logger.info("[2/4] Cleaning and deduplicating leads as they arrive...")
+        index = LeadIndex() if args.incremental or args.compact_index else None
+        leads = clean_stream(([lead for _, lead in batch] for batch in sources),
+                             index=index if args.incremental else None)
         
-        logger.info("\n[3/5] Cleaning and merging leads...")
-        merged_leads = clean_and_merge(google_maps_leads, justdial_leads)
-        logger.info(f"✓ Total unique leads: {len(merged_leads)}")
+        if args.incremental:
+            leads = (lead for lead in leads if lead.get('is_new'))
         
-        if not args.skip_instagram and merged_leads:
-            logger.info("\n[4/5] Finding Instagram profiles...")
-            count = 0
-            for lead in merged_leads:
-                try:
-                    instagram = find_instagram(lead.get('name'), lead.get('website'))
-                    if instagram:
-                        lead['instagram'] = instagram
-                        count += 1
-                except Exception as e:
-                    logger.error(f"Error finding Instagram for {lead.get('name')}: {str(e)}")
-            logger.info(f"✓ Found {count} Instagram profiles")
+        enrich_stats = {}
+        if not args.skip_instagram:
+            logger.info("[3/4] Finding website contacts and Instagram profiles as leads arrive...")
+            leads = enrich_stream(leads, stats=enrich_stats)
         else:
-            logger.info("\n[4/5] Skipping Instagram search")
-            for lead in merged_leads:
-                lead['instagram'] = None
+            logger.info("[3/4] Skipping website contacts and Instagram search")
+        
+        logger.info("[4/4] Exporting leads as they are ready...")
+        with LeadWriter(args.keyword, args.city) as writer:
+            for lead in leads:
+                writer.write(lead)
+                # Likhe jaane ke baad hi index me, taaki crash / Ctrl-C par unexported lead "known" na bane
+                if args.incremental and lead.get('is_new'):
+                    index.remember([lead])
+        csv_path, excel_path = writer.csv_path, writer.excel_path
+        
+        for name, stat in source_stats.items():
+            logger.info(f"✓ {SOURCE_LABELS[name]}: {stat['leads']} leads found ({stat['seconds']}s)")
+        
+        found = enrich_stats.get('found')
+        if found:
+            logger.info(f"✓ Found {found['instagram']} Instagram profiles, {found['email']} emails, "
+                        f"{found['facebook']} Facebook, {found['linkedin']} LinkedIn, {found['whatsapp']} WhatsApp")
+        
+        if args.compact_index:
+            index.compact()
         
-        logger.info("\n[5/5] Exporting leads...")
-        csv_path, excel_path = export_leads(merged_leads, args.keyword, args.city)
+        # Connection reuse aur response cache kitna kaam aaya
+        http_stats = get_http_stats()
+        logger.info(f"✓ HTTP: {http_stats['requests']} requests over {http_stats['connections']} connections "
+                    f"({http_stats['reused']} reused, {http_stats['truncated']} truncated)")
+        if http_stats['cache']:
+            logger.info(f"✓ HTTP cache: {http_stats['cache']['hits']} hits, {http_stats['cache']['misses']} misses, "
+                        f"{http_stats['cache']['revalidated']} revalidated")
         
         logger.info("\n" + "=" * 60)
         logger.info("LEAD GENERATION COMPLETE!")
         logger.info("=" * 60)
-        logger.info(f"Total leads: {len(merged_leads)}")
+        logger.info(f"Total leads: {writer.count}")
         if csv_path:
             logger.info(f"CSV file: {csv_path}")
         if excel_path:
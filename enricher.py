@@ -0,0 +1,66 @@
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from scrapers.instagram_finder import find_instagram
+from scrapers.website_contacts import find_contacts, empty_contacts, CONTACT_FIELDS
+from utils.config import get_config
+from utils.logger import logger
+
+def enrich_stream(leads, concurrency=None, stats=None):
+    # Leads aate hi thread pool me, aur input order me yield. Kul kitne saath chalenge wo
+    # enrichment.concurrency se, aur google.com / har website par alag cap utils/http_client
+    # ke per-host slots se lagta hai. In-flight leads concurrency ke 2 guna tak; usse aage
+    # upstream ruk jaata hai. stats dict (agar diya) me 'found' (field -> count) aur
+    # 'timings' (har lead ke seconds, order me).
+    if concurrency is None:
+        concurrency = get_config().enrichment.concurrency
+    concurrency = max(1, concurrency)
+
+    if stats is None:
+        stats = {}
+    found = stats.setdefault('found', {field: 0 for field in CONTACT_FIELDS})
+    timings = stats.setdefault('timings', [])
+    names = []
+    started = time.monotonic()
+    window = deque()
+
+    def finished(lead, future):
+        timings.append(future.result())
+        names.append(lead.get('name'))
+        for field in CONTACT_FIELDS:
+            if lead.get(field):
+                found[field] += 1
+        return lead
+
+    # Consumer beech me ruk jaaye (generator close) to queue me pade leads cancel
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    try:
+        for lead in leads:
+            window.append((lead, executor.submit(enrich_lead, lead)))
+            while len(window) >= concurrency * 2 or (window and window[0][1].done()):
+                yield finished(*window.popleft())
+        while window:
+            yield finished(*window.popleft())
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+    if timings:
+        slowest = max(range(len(timings)), key=lambda idx: timings[idx])
+        logger.info(f"Enrichment: {len(timings)} leads in {time.monotonic() - started:.1f}s "
+                    f"(avg {sum(timings) / len(timings):.1f}s, slowest {timings[slowest]:.1f}s: {names[slowest]})")
+
+def enrich_lead(lead):
+    # Website ek hi baar fetch hoti hai (saare contact fields usi se); Instagram na mile
+    # to naam se Google search
+    started = time.monotonic()
+    try:
+        contacts = find_contacts(lead.get('website'))
+        name = lead.get('name')
+        if not contacts['instagram'] and name:
+            contacts['instagram'] = find_instagram(name)
+        lead.update(contacts)
+    except Exception as e:
+        logger.error(f"Error enriching {lead.get('name')}: {str(e)}")
+        for field, value in empty_contacts().items():
+            lead.setdefault(field, value)
+    return time.monotonic() - started
@@ -1,13 +1,12 @@
-import pandas as pd
+import csv
+import time
 from datetime import datetime
 import os
 from utils.logger import logger
 
-def export_leads(leads, keyword, city):
-    if not leads:
-        logger.warning("No leads to export")
-        return None, None
-    
+COLUMN_ORDER = ['name', 'phone', 'website', 'address', 'category', 'rating', 'latitude', 'longitude', 'email', 'instagram', 'facebook', 'linkedin', 'whatsapp', 'maps_url', 'source']
+
+def export_paths(keyword, city):
     os.makedirs('outputs', exist_ok=True)
     
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -15,29 +14,84 @@ def export_leads(leads, keyword, city):
     city_safe = city.replace(' ', '_').replace('/', '_')
     
     base_filename = f"leads_{keyword_safe}_{city_safe}_{timestamp}"
-    csv_path = os.path.join('outputs', f"{base_filename}.csv")
-    excel_path = os.path.join('outputs', f"{base_filename}.xlsx")
-    
-    df = pd.DataFrame(leads)
-    
-    column_order = ['name', 'phone', 'website', 'address', 'instagram', 'maps_url', 'source']
-    existing_columns = [col for col in column_order if col in df.columns]
-    df = df[existing_columns]
-    
-    try:
-        df.to_csv(csv_path, index=False, encoding='utf-8')
-        logger.info(f"CSV exported to: {csv_path}")
-    except Exception as e:
-        logger.error(f"Error exporting CSV: {str(e)}")
-        csv_path = None
-    
-    try:
-        df.to_excel(excel_path, index=False, engine='openpyxl')
-        logger.info(f"Excel exported to: {excel_path}")
-    except Exception as e:
-        logger.error(f"Error exporting Excel: {str(e)}")
-        excel_path = None
-    
-    logger.info(f"Total leads exported: {len(leads)}")
-    
-    return csv_path, excel_path
+    return os.path.join('outputs', f"{base_filename}.csv"), os.path.join('outputs', f"{base_filename}.xlsx")
+
+# Streaming export: har lead aate hi CSV me likh kar flush (beech me crash ho to bhi
+# ab tak ke leads file me), Excel write-only sheet me append aur close par save.
+# Files pehli lead par bante hain; koi lead na aaye to kuch nahi banta.
+class LeadWriter:
+    def __init__(self, keyword, city):
+        self.keyword = keyword
+        self.city = city
+        self.csv_path = None
+        self.excel_path = None
+        self.count = 0
+        self.started = time.monotonic()
+        self._csv_file = None
+        self._csv = None
+        self._workbook = None
+        self._sheet = None
+
+    def _open(self):
+        self.csv_path, self.excel_path = export_paths(self.keyword, self.city)
+
+        try:
+            self._csv_file = open(self.csv_path, 'w', newline='', encoding='utf-8')
+            self._csv = csv.DictWriter(self._csv_file, fieldnames=COLUMN_ORDER, extrasaction='ignore')
+            self._csv.writeheader()
+        except Exception as e:
+            logger.error(f"Error exporting CSV: {str(e)}")
+            self.csv_path = None
+
+        # openpyxl na ho to bhi CSV likha jaata hai, sirf Excel skip
+        try:
+            from openpyxl import Workbook
+            self._workbook = Workbook(write_only=True)
+            self._sheet = self._workbook.create_sheet()
+            self._sheet.append(COLUMN_ORDER)
+        except Exception as e:
+            logger.error(f"Error exporting Excel: {str(e)}")
+            self.excel_path = None
+            self._workbook = None
+            self._sheet = None
+
+    def write(self, lead):
+        if self.count == 0:
+            self._open()
+            logger.info(f"First lead ready after {time.monotonic() - self.started:.1f}s")
+
+        # Phone cleaner (normalize_phones) me normalize ho chuka hai
+        if self._csv is not None:
+            self._csv.writerow(lead)
+            self._csv_file.flush()
+        if self._sheet is not None:
+            self._sheet.append([lead.get(column) for column in COLUMN_ORDER])
+        self.count += 1
+
+    def close(self):
+        if self.count == 0:
+            logger.warning("No leads to export")
+            return None, None
+
+        if self._csv_file is not None:
+            self._csv_file.close()
+            self._csv_file = None
+            logger.info(f"CSV exported to: {self.csv_path}")
+
+        if self._workbook is not None:
+            try:
+                self._workbook.save(self.excel_path)
+                logger.info(f"Excel exported to: {self.excel_path}")
+            except Exception as e:
+                logger.error(f"Error exporting Excel: {str(e)}")
+                self.excel_path = None
+            self._workbook = None
+
+        logger.info(f"Total leads exported: {self.count}")
+        return self.csv_path, self.excel_path
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
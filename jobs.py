@@ -0,0 +1,154 @@
+import atexit
+import queue
+import threading
+import time
+import uuid
+from utils.config import get_config
+from utils.logger import logger
+
+JOB_STATES = ('queued', 'running', 'done', 'failed', 'cancelled')
+FINISHED_STATES = ('done', 'failed', 'cancelled')
+
+class JobQueueFull(Exception):
+    pass
+
+# API ke background scrape jobs: fixed workers ek queue se job uthate hain. Queue ki
+# capacity live queued jobs ki ginti se lagti hai, taaki cancel hue jobs (jo queue me
+# tab tak pade rehte hain jab tak koi worker unhe skip na kare) jagah na gheren.
+# Job fn(params, cancel) ko chalata hai; cancel ek threading.Event hai jise fn beech
+# beech me check kare. Khatam jobs ka result result_ttl seconds tak rehta hai.
+class JobManager:
+    def __init__(self, fn, workers=2, max_queue=20, result_ttl=3600):
+        self.fn = fn
+        self.workers = workers
+        self.max_queue = max_queue
+        self.result_ttl = result_ttl
+
+        self._queue = queue.Queue()
+        self._queued = 0
+        self._jobs = {}
+        self._lock = threading.Lock()
+        self._threads = []
+        self.stats = {'submitted': 0, 'rejected': 0, 'done': 0, 'failed': 0, 'cancelled': 0, 'expired': 0}
+
+        for idx in range(workers):
+            thread = threading.Thread(target=self._work, name=f'job-worker-{idx}', daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def submit(self, params):
+        job = {
+            'id': uuid.uuid4().hex,
+            'status': 'queued',
+            'params': params,
+            'created': time.time(),
+            'started': None,
+            'finished': None,
+            'result': None,
+            'error': None,
+            'cancel': threading.Event(),
+        }
+        with self._lock:
+            self._purge()
+            if self._queued >= self.max_queue:
+                self.stats['rejected'] += 1
+                raise JobQueueFull(f"Job queue is full ({self.max_queue} waiting)")
+            self._queue.put_nowait(job)
+            self._queued += 1
+            self._jobs[job['id']] = job
+            self.stats['submitted'] += 1
+        return self.view(job)
+
+    def get(self, job_id):
+        with self._lock:
+            self._purge()
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id):
+        # Queued job turant cancel; running job apne agle check par rukta hai
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job['status'] in FINISHED_STATES:
+                return job
+            job['cancel'].set()
+            if job['status'] == 'queued':
+                self._queued -= 1
+                self._finish(job, 'cancelled')
+            return job
+
+    def view(self, job):
+        return {
+            'job_id': job['id'],
+            'status': job['status'],
+            'params': job['params'],
+            'created': job['created'],
+            'started': job['started'],
+            'finished': job['finished'],
+            'error': job['error'],
+        }
+
+    def health(self):
+        with self._lock:
+            self._purge()
+            counts = {state: 0 for state in JOB_STATES}
+            for job in self._jobs.values():
+                counts[job['status']] += 1
+            return {'workers': self.workers, 'max_queue': self.max_queue, 'jobs': counts, **self.stats}
+
+    def _work(self):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            with self._lock:
+                if job['status'] != 'queued':
+                    continue
+                self._queued -= 1
+                job['status'] = 'running'
+                job['started'] = time.time()
+
+            try:
+                result = self.fn(job['params'], job['cancel'])
+            except Exception as e:
+                logger.error(f"Job {job['id']} failed: {str(e)}")
+                with self._lock:
+                    job['error'] = str(e)
+                    self._finish(job, 'failed')
+                continue
+
+            with self._lock:
+                job['result'] = result
+                self._finish(job, 'cancelled' if job['cancel'].is_set() else 'done')
+
+    def _finish(self, job, status):
+        job['status'] = status
+        job['finished'] = time.time()
+        self.stats[status] += 1
+
+    def _purge(self):
+        cutoff = time.time() - self.result_ttl
+        expired = [job_id for job_id, job in self._jobs.items()
+                   if job['status'] in FINISHED_STATES and job['finished'] < cutoff]
+        for job_id in expired:
+            del self._jobs[job_id]
+        self.stats['expired'] += len(expired)
+
+    def close(self):
+        with self._lock:
+            for job in self._jobs.values():
+                job['cancel'].set()
+        for _ in self._threads:
+            self._queue.put_nowait(None)
+
+_manager = None
+_manager_lock = threading.Lock()
+
+def get_job_manager(fn):
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            settings = get_config().jobs
+            _manager = JobManager(fn, workers=max(1, settings.workers), max_queue=max(1, settings.max_queue),
+                                  result_ttl=settings.result_ttl)
+            atexit.register(_manager.close)
+        return _manager
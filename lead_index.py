@@ -0,0 +1,171 @@
+import os
+import re
+import sqlite3
+import threading
+import time
+from rapidfuzz import fuzz, process
+from cleaner import normalize_name, website_domain
+from utils.logger import logger
+from utils.config import get_config
+
+NAME_TOKEN_RE = re.compile(r'[^\W_]+')
+BLOCK_PREFIX_LEN = 3
+
+# "dental", "clinic" jaise common tokens ke blocks lagbhag poora index hote hain,
+# unhe lookup me tabhi use karte hain jab name me aur kuch na ho
+GENERIC_BLOCK_MIN = 50
+GENERIC_BLOCK_RATIO = 0.05
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS leads (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    phone TEXT,
+    domain TEXT,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_leads_phone ON leads(phone);
+CREATE INDEX IF NOT EXISTS idx_leads_domain ON leads(domain);
+CREATE INDEX IF NOT EXISTS idx_leads_last_seen ON leads(last_seen);
+CREATE TABLE IF NOT EXISTS name_keys (
+    key TEXT NOT NULL,
+    lead_id INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_name_keys_key ON name_keys(key);
+CREATE INDEX IF NOT EXISTS idx_name_keys_lead ON name_keys(lead_id);
+"""
+
+def name_block_keys(normalized_name):
+    keys = {token[:BLOCK_PREFIX_LEN] for token in NAME_TOKEN_RE.findall(normalized_name)}
+    return keys or {normalized_name}
+
+def get_index_settings():
+    return get_config().lead_index
+
+# Pichle runs ke leads ka on-disk index (phone, website domain, name signature).
+# Matching: same phone, ya name ke blocking keys / domain wale candidates me fuzzy name.
+class LeadIndex:
+    def __init__(self, path=None, similarity_threshold=85):
+        self.path = path or get_index_settings().path
+        self.similarity_threshold = similarity_threshold
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.executescript(SCHEMA)
+
+    def find(self, lead, generic_limit=None):
+        name = (lead.get('name') or '').strip()
+        if not name:
+            return None
+
+        phone = lead.get('phone')
+        if phone:
+            row = self._conn.execute('SELECT id FROM leads WHERE phone = ? LIMIT 1', (phone,)).fetchone()
+            if row:
+                return row[0]
+
+        if generic_limit is None:
+            generic_limit = self._generic_limit()
+
+        normalized = normalize_name(name)
+        candidates = self._candidates(name_block_keys(normalized), website_domain(lead.get('website')), generic_limit)
+        if not candidates:
+            return None
+
+        match = process.extractOne(normalized, candidates, scorer=fuzz.ratio, score_cutoff=self.similarity_threshold)
+        return match[2] if match else None
+
+    def _generic_limit(self):
+        total = self._conn.execute('SELECT COUNT(*) FROM leads').fetchone()[0]
+        return max(GENERIC_BLOCK_MIN, total * GENERIC_BLOCK_RATIO)
+
+    def _candidates(self, keys, domain, generic_limit):
+        sizes = {
+            key: self._conn.execute('SELECT COUNT(*) FROM name_keys WHERE key = ?', (key,)).fetchone()[0]
+            for key in keys
+        }
+        lookup_keys = [key for key, size in sizes.items() if size <= generic_limit] or list(keys)
+
+        candidates = {}
+        if lookup_keys:
+            placeholders = ','.join('?' * len(lookup_keys))
+            rows = self._conn.execute(
+                f'SELECT leads.id, leads.name FROM name_keys JOIN leads ON leads.id = name_keys.lead_id '
+                f'WHERE name_keys.key IN ({placeholders})',
+                lookup_keys
+            )
+            candidates.update(rows)
+        if domain:
+            candidates.update(self._conn.execute('SELECT id, name FROM leads WHERE domain = ?', (domain,)))
+        return candidates
+
+    def add(self, lead, now=None):
+        now = now or time.time()
+        normalized = normalize_name(lead['name'].strip())
+        cursor = self._conn.execute(
+            'INSERT INTO leads (name, phone, domain, first_seen, last_seen) VALUES (?, ?, ?, ?, ?)',
+            (normalized, lead.get('phone'), website_domain(lead.get('website')), now, now)
+        )
+        lead_id = cursor.lastrowid
+        self._conn.executemany(
+            'INSERT INTO name_keys (key, lead_id) VALUES (?, ?)',
+            [(key, lead_id) for key in name_block_keys(normalized)]
+        )
+        return lead_id
+
+    def mark(self, leads, log=True, add=True):
+        # Har lead par 'is_new' set karta hai; naye leads index me add, purane ka last_seen update.
+        # add=False: naye leads abhi add nahi hote, caller unke export ke baad remember() karta
+        # hai (beech me crash ho to wo "known" ban kar agle runs me chhoot na jayein)
+        now = time.time()
+        new_count = 0
+        with self._lock, self._conn:
+            generic_limit = self._generic_limit()
+            for lead in leads:
+                lead_id = self.find(lead, generic_limit)
+                if lead_id is None:
+                    if add:
+                        self.add(lead, now)
+                    lead['is_new'] = True
+                    new_count += 1
+                else:
+                    self._conn.execute('UPDATE leads SET last_seen = ? WHERE id = ?', (now, lead_id))
+                    lead['is_new'] = False
+
+        if log:
+            logger.info(f"Lead index: {new_count} new, {len(leads) - new_count} already known")
+        return leads
+
+    def remember(self, leads):
+        now = time.time()
+        with self._lock, self._conn:
+            for lead in leads:
+                self.add(lead, now)
+
+    def compact(self, max_age_days=None):
+        if max_age_days is None:
+            max_age_days = get_index_settings().max_age_days
+
+        with self._lock:
+            with self._conn:
+                removed = 0
+                if max_age_days:
+                    cutoff = time.time() - max_age_days * 86400
+                    self._conn.execute(
+                        'DELETE FROM name_keys WHERE lead_id IN (SELECT id FROM leads WHERE last_seen < ?)', (cutoff,)
+                    )
+                    removed = self._conn.execute('DELETE FROM leads WHERE last_seen < ?', (cutoff,)).rowcount
+            self._conn.execute('VACUUM')
+
+        logger.info(f"Lead index compacted: removed {removed} leads not seen in {max_age_days} days")
+        return removed
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
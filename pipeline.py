@@ -0,0 +1,192 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from scrapers.google_maps import scrape_google_maps
+from scrapers.justdial import scrape_justdial
+from cleaner import clean_stream
+from enricher import enrich_stream
+from utils.config import get_config
+from utils.logger import logger
+
+SOURCE_LABELS = {
+    'google_maps': 'Google Maps',
+    'justdial': 'JustDial',
+}
+
+SOURCE_DONE = object()
+CANCEL_POLL_INTERVAL = 0.5
+
+def stream_leads(keyword, city, limit, pool=None, maps_mode=None, maps_backend=None,
+                 justdial_mode=None, skip_justdial=False, skip_instagram=False, cancel=None, stats=None):
+    # Scrape -> clean/dedupe -> enrich, har lead tayyar hote hi yield (API ke liye; CLI
+    # isi tarah stages khud jodta hai kyunki use lead index bhi chahiye)
+    sources = stream_sources(keyword, city, limit, pool=pool, maps_mode=maps_mode, maps_backend=maps_backend,
+                             justdial_mode=justdial_mode, skip_justdial=skip_justdial, cancel=cancel, stats=stats,
+                             batches=True)
+    leads = clean_stream([lead for _, lead in batch] for batch in sources)
+    if not skip_instagram:
+        leads = enrich_stream(leads)
+    try:
+        for lead in leads:
+            if cancel is not None and cancel.is_set():
+                break
+            yield lead
+    finally:
+        # Stages turant band (refcount ke bharose nahi), taaki scrapers ka stop set ho
+        leads.close()
+        sources.close()
+
+def stream_sources(keyword, city, limit, pool=None, maps_mode=None, maps_backend=None,
+                   justdial_mode=None, skip_justdial=False, cancel=None, stats=None, batches=False):
+    # Google Maps aur JustDial ek saath chalte hain aur har lead milte hi (source, lead)
+    # yield hota hai (batches=True: us waqt queue me pade saare leads ek list me). Har source ka apna timeout hai aur ek fail / timeout ho to doosre
+    # ke leads phir bhi milte hain. Queue bhari ho (consumer slow) to scraper wahin rukta
+    # hai; wo ruka hua time source ke timeout me nahi gina jaata. stats dict (agar diya)
+    # me source wise status / leads / seconds. cancel (threading.Event) set hote hi stream
+    # ruk jaata hai. Timeout / cancel / stream band hone par source ka stop event set hota
+    # hai, jisse scraper ka browser context aur HTTP slots turant chhoot jaate hain.
+    settings = get_config().pipeline
+    jobs = {
+        'google_maps': (
+            lambda emit, stop: scrape_google_maps(keyword, city, limit, pool=pool, mode=maps_mode,
+                                                  backend=maps_backend, on_lead=emit, stop=stop),
+            settings.google_maps_timeout,
+        ),
+    }
+    if not skip_justdial:
+        jobs['justdial'] = (
+            lambda emit, stop: scrape_justdial(keyword, city, limit, mode=justdial_mode, pool=pool,
+                                               on_lead=emit, stop=stop),
+            settings.justdial_timeout,
+        )
+
+    if stats is None:
+        stats = {}
+    max_queued = max(1, settings.queue_size)
+    leads = deque()
+    ready = threading.Condition()
+    pending = set(jobs)
+    # closed: in sources ke naye leads nahi liye jaate (timeout / consumer chala gaya);
+    # jo pehle se queue me hain wo phir bhi nikalte hain
+    closed = set()
+    queued = {name: 0 for name in jobs}
+    blocked = {name: 0.0 for name in jobs}
+    counts = {name: 0 for name in jobs}
+    stops = {name: threading.Event() for name in jobs}
+
+    def put(name, item):
+        waited = time.monotonic()
+        with ready:
+            while name not in closed and len(leads) >= max_queued:
+                ready.wait(CANCEL_POLL_INTERVAL)
+            if name not in closed:
+                leads.append((name, item))
+                queued[name] += 1
+                ready.notify_all()
+        blocked[name] += time.monotonic() - waited
+
+    def run(name, job):
+        # DONE source ke apne thread se, taaki bhari queue par consumer na atke
+        try:
+            return job(lambda lead: put(name, lead), stops[name])
+        finally:
+            put(name, SOURCE_DONE)
+
+    started = time.monotonic()
+    futures = {name: run_in_thread(lambda name=name, job=job: run(name, job)) for name, (job, _) in jobs.items()}
+
+    def deadline(name):
+        return started + jobs[name][1] + blocked[name]
+
+    try:
+        while pending:
+            if cancel is not None and cancel.is_set():
+                break
+
+            with ready:
+                now = time.monotonic()
+                for name in [name for name in pending - closed if now >= deadline(name)]:
+                    closed.add(name)
+                    stops[name].set()
+                    logger.error(f"{SOURCE_LABELS[name]} timed out after {jobs[name][1]}s, "
+                                 f"continuing without it ({queued[name]} leads already queued are kept)")
+                # Timed out source tab khatam jab uske queued leads nikal chuke
+                for name in [name for name in pending & closed if not queued[name]]:
+                    pending.discard(name)
+                    stats[name] = {'status': 'timeout', 'leads': counts[name], 'seconds': jobs[name][1]}
+                if not pending:
+                    break
+
+                if not leads:
+                    running = pending - closed
+                    timeout = max(0, min(deadline(name) for name in running) - now) if running else 0
+                    if cancel is not None:
+                        timeout = min(timeout, CANCEL_POLL_INTERVAL)
+                    ready.wait(timeout)
+                    continue
+
+                items = list(leads)
+                leads.clear()
+                for name, _ in items:
+                    queued[name] -= 1
+                ready.notify_all()
+
+            batch = []
+            for name, item in items:
+                if item is SOURCE_DONE:
+                    pending.discard(name)
+                    future = futures[name]
+                    error = future.exception()
+                    if error is None:
+                        stats[name] = {'status': 'ok', 'leads': counts[name], 'seconds': round(future.elapsed, 1)}
+                    else:
+                        logger.error(f"{SOURCE_LABELS[name]} failed: {str(error)}")
+                        stats[name] = {'status': 'error', 'leads': counts[name], 'seconds': round(future.elapsed, 1),
+                                       'error': str(error)}
+                    continue
+                counts[name] += 1
+                batch.append((name, item))
+
+            if batches:
+                if batch:
+                    yield batch
+            else:
+                yield from batch
+    finally:
+        # Consumer beech me ruk gaya (close / exception): scrapers ke aage ke leads drop
+        with ready:
+            for name in pending:
+                stats.setdefault(name, {'status': 'cancelled', 'leads': counts[name],
+                                        'seconds': round(time.monotonic() - started, 1)})
+            pending.clear()
+            closed.update(jobs)
+            leads.clear()
+            ready.notify_all()
+        for stop in stops.values():
+            stop.set()
+
+    for name, stat in stats.items():
+        logger.info(f"{SOURCE_LABELS[name]}: {stat['leads']} leads in {stat['seconds']}s ({stat['status']})")
+
+def run_in_thread(fn):
+    # Daemon thread: timeout ke baad bhi chal raha scraper process ko exit hone se nahi rokta.
+    # future.elapsed = source ka apna wall time
+    future = Future()
+    future.elapsed = 0.0
+
+    def target():
+        if not future.set_running_or_notify_cancel():
+            return
+        started = time.monotonic()
+        try:
+            result = fn()
+        except BaseException as e:
+            future.elapsed = time.monotonic() - started
+            future.set_exception(e)
+        else:
+            future.elapsed = time.monotonic() - started
+            future.set_result(result)
+
+    threading.Thread(target=target, daemon=True).start()
+    return future
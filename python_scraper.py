@@ -1,7 +1,6 @@
 import time
 import pandas as pd
 import re
-import requests
 from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -9,6 +8,7 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
 from urllib.parse import urlparse
+from utils.http_client import fetch
 
 # --- EMAIL EXTRACTION FUNCTION ---
 def extract_email_from_website(website_url):
@@ -18,7 +18,7 @@ def extract_email_from_website(website_url):
     try:
         # Website par jao (Timeout 5 second rakha hai taaki script slow na ho)
         headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'}
-        response = requests.get(website_url, headers=headers, timeout=5)
+        response = fetch(website_url, source='websites', headers=headers, timeout=5)
         
         # Agar website khul gayi
         if response.status_code == 200:
@@ -0,0 +1,159 @@
+import re
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from utils.config import get_config
+
+WHITESPACE_RE = re.compile(r'\s+')
+WAIT_POLL_INTERVAL = 0.5
+
+def normalize_text(value):
+    return WHITESPACE_RE.sub(' ', str(value or '')).strip().lower()
+
+def cache_key(params):
+    # limit key me nahi hai: bade limit wala result chhote limit ko bhi serve karta hai.
+    # None modes config.yml ki default value se bhare jaate hain, taaki dono ek hi key banein
+    config = get_config()
+    return (
+        normalize_text(params['keyword']),
+        normalize_text(params['city']),
+        params.get('mode') or config.google_maps.mode,
+        params.get('backend') or config.google_maps.backend,
+        params.get('justdial_mode') or config.justdial.mode,
+        bool(params.get('skip_instagram')),
+        bool(params.get('skip_justdial')),
+    )
+
+def trim_result(result, limit, cache_status):
+    # Har source ke pehle `limit` leads (scrapers bhi source wise limit lagate hain)
+    kept = {}
+    data = []
+    for lead in result['data']:
+        source = lead.get('source')
+        if kept.get(source, 0) < limit:
+            kept[source] = kept.get(source, 0) + 1
+            data.append(lead)
+    return dict(result, total_leads=len(data), data=data, cache=cache_status)
+
+def cacheable(result):
+    # Sirf poora result: koi source error / timeout / cancel hua ho, ya kisi source ne
+    # 0 leads diye hon (block / captcha page jo error nahi banta), to agli request phir
+    # se scrape kare, degraded result TTL bhar na chale
+    sources = result.get('sources', {})
+    return result.get('status') == 'success' and bool(sources) and all(
+        stat.get('status') == 'ok' and stat.get('leads') for stat in sources.values()
+    )
+
+# /api/scrape aur jobs ke results ka in-memory TTL cache, plus single-flight: ek hi
+# params ke saath chal rahe scrape ka result baaki identical requests share karti hain
+class ScrapeCache:
+    def __init__(self, ttl=600, max_entries=100):
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._inflight = {}
+        self.stats = {'hits': 0, 'misses': 0, 'coalesced': 0}
+
+    def lookup(self, params):
+        key = cache_key(params)
+        with self._lock:
+            result = self._cached(key, params['limit'])
+            self.stats['hits' if result else 'misses'] += 1
+        return trim_result(result, params['limit'], 'hit') if result else None
+
+    def get_or_run(self, params, run, cancel=None, refresh=False):
+        # run(params, cancel) -> result dict (cacheable() wale hi cache hote hain)
+        key = cache_key(params)
+        limit = params['limit']
+        with self._lock:
+            result = None if refresh else self._cached(key, limit)
+            if result:
+                self.stats['hits'] += 1
+                return trim_result(result, limit, 'hit')
+
+            inflight = self._inflight.get(key)
+            if inflight and inflight[0] >= limit and not refresh:
+                self.stats['coalesced'] += 1
+            else:
+                self.stats['misses'] += 1
+                inflight = None
+                future = Future()
+                self._inflight[key] = (limit, future)
+
+        if inflight:
+            result = self._wait(inflight[1], cancel)
+            if result and result.get('status') == 'success':
+                return trim_result(result, limit, 'coalesced')
+            if cancel is not None and cancel.is_set():
+                return {"status": "cancelled", "total_leads": 0, "sources": {}, "data": []}
+            # Leader fail / cancel hua: ye request khud scrape karti hai
+            return self.get_or_run(params, run, cancel, refresh=True)
+
+        try:
+            result = run(params, cancel)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                if self._inflight.get(key, (None, None))[1] is future:
+                    del self._inflight[key]
+        future.set_result(result)
+
+        if cacheable(result):
+            self._store(key, limit, result)
+        return dict(result, cache='miss')
+
+    def health(self):
+        with self._lock:
+            self._purge()
+            return {'entries': len(self._entries), 'inflight': len(self._inflight), **self.stats}
+
+    def _wait(self, future, cancel):
+        while True:
+            try:
+                return future.result(timeout=WAIT_POLL_INTERVAL)
+            except FutureTimeout:
+                if cancel is not None and cancel.is_set():
+                    return None
+            except Exception:
+                return None
+
+    def _cached(self, key, limit):
+        entry = self._entries.get(key)
+        if entry and entry[0] > time.time() and entry[1] >= limit:
+            return entry[2]
+        return None
+
+    def _store(self, key, limit, result):
+        with self._lock:
+            entry = self._entries.get(key)
+            # Abhi valid bada result chhote naye result se zyada kaam ka hai
+            if entry and entry[0] > time.time() and entry[1] > limit:
+                return
+            self._entries.pop(key, None)
+            self._entries[key] = (time.time() + self.ttl, limit, result)
+            self._purge()
+            while len(self._entries) > self.max_entries:
+                del self._entries[next(iter(self._entries))]
+
+    def _purge(self):
+        now = time.time()
+        for key in [key for key, entry in self._entries.items() if entry[0] <= now]:
+            del self._entries[key]
+
+_cache = None
+_cache_lock = threading.Lock()
+
+def get_scrape_cache():
+    # scrape_cache.enabled false ho to None (har request apna scrape chalati hai)
+    global _cache
+    settings = get_config().scrape_cache
+    if not settings.enabled:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = ScrapeCache(ttl=settings.ttl, max_entries=max(1, settings.max_entries))
+        return _cache
@@ -1,128 +1,453 @@
-import time
+import asyncio
+import re
 import urllib.parse
-from playwright.sync_api import sync_playwright
+from concurrent.futures import ThreadPoolExecutor
+from playwright.async_api import async_playwright
+from scrapers.maps_parser import FEATURE_ID_RE, parse_search_payload, parse_place_state, parse_feed_card, parse_rating, parse_coordinates
 from utils.logger import logger
+from utils.config import get_config
+from utils.http_client import fetch
 from utils.proxies import get_random_user_agent
+from utils.retryer import retry
 
-def scrape_google_maps(keyword, city, limit=50):
+FEED_SELECTOR = 'div[role="feed"]'
+PLACE_LINK_SELECTOR = 'a[href*="/maps/place/"]'
+CARD_SELECTOR = 'div[role="article"]'
+CARD_SEEN_ATTR = 'data-leadgen-seen'
+END_OF_LIST_TEXT = "You've reached the end of the list"
+
+# Place page ke fields: selector, optional attribute (warna innerText), aur hataane wala prefix
+PLACE_FIELDS = {
+    'name': {'selector': 'h1'},
+    'phone': {'selector': 'button[data-item-id*="phone:tel:"]', 'attr': 'data-item-id', 'strip': 'phone:tel:'},
+    'website': {'selector': 'a[data-item-id="authority"]', 'attr': 'href'},
+    'address': {'selector': 'button[data-item-id="address"]', 'attr': 'aria-label', 'strip': 'Address: '},
+    'rating': {'selector': 'div.F7nice span[aria-hidden="true"]'},
+    'category': {'selector': 'button[jsaction*="category"]'},
+}
+
+EXTRACT_PLACE_JS = """
+(fields) => {
+    const out = {url: location.href};
+    for (const [key, spec] of Object.entries(fields)) {
+        const el = document.querySelector(spec.selector);
+        let value = el ? (spec.attr ? el.getAttribute(spec.attr) : el.innerText) : null;
+        if (value && spec.strip) value = value.replace(spec.strip, '');
+        out[key] = value ? value.trim() : null;
+    }
+    return out;
+}
+"""
+
+EXTRACT_NEW_CARDS_JS = """
+([selector, seenAttr]) => Array.from(document.querySelectorAll(`${selector}:not([${seenAttr}])`)).map(card => {
+    card.setAttribute(seenAttr, '1');
+    const link = card.querySelector('a[href*="/maps/place/"]');
+    const website = card.querySelector('a[data-value="Website"]');
+    const rating = card.querySelector('span[role="img"][aria-label]');
+    return {
+        name: card.getAttribute('aria-label'),
+        url: link ? link.href : null,
+        website: website ? website.href : null,
+        rating: rating ? rating.getAttribute('aria-label') : null,
+        text: card.innerText,
+    };
+})
+"""
+
+# Feed scroll hote waqt Maps '/search?tbm=map' XHR se results laata hai
+SEARCH_XHR_RE = re.compile(r'/search\?.*tbm=map')
+
+MAPS_MODES = ('detail', 'feed', 'list')
+MAPS_BACKENDS = ('playwright', 'http')
+STOP_POLL_INTERVAL = 0.5
+
+# Scrape chala hi nahi (browser crash, consent / captcha page, results list nahi mili).
+# Pipeline ise source ka 'error' status banati hai, taaki khali result "0 leads mile"
+# jaisa na dikhe aur cache na ho
+class ScrapeError(Exception):
+    pass
+
+# EU consent redirect se bachne ke liye (HTTP backend)
+CONSENT_COOKIES = {'CONSENT': 'YES+cb', 'SOCS': 'CAI'}
+
+def get_maps_settings():
+    return get_config().google_maps
+
+def get_detail_concurrency():
+    return max(1, get_maps_settings().detail_concurrency)
+
+def scrape_google_maps(keyword, city, limit=50, concurrency=None, pool=None, mode=None, backend=None, on_lead=None,
+                       stop=None):
+    # mode: 'detail' har place page kholta hai, 'feed' search XHR payload se
+    # leads banata hai aur sirf adhoore leads ke liye place page kholta hai,
+    # 'list' sirf feed cards padhta hai (sabse fast, address/category nahi milte).
+    # backend: place pages 'playwright' se ya 'http' se (browser sirf fallback)
+    # on_lead(lead): har lead tayyar hote hi (streaming pipeline ke liye); ye block kar
+    # sakta hai, event loop par nahi chalta. stop (threading.Event): set hote hi scrape
+    # cancel aur browser context wapas pool me (job cancel / source timeout)
     logger.info(f"Starting Google Maps scraper for '{keyword}' in '{city}'")
-    results = []
-    
-    with sync_playwright() as p:
+
+    if concurrency is None:
+        concurrency = get_detail_concurrency()
+    if mode is None:
+        mode = get_maps_settings().mode
+    if backend is None:
+        backend = get_maps_settings().backend
+
+    # Server (app.py) shared pool deta hai, CLI apna browser khud launch karta hai
+    if pool is not None:
+        return pool.run(run_until_stopped, stop, _scrape_with_pool, pool, keyword, city, limit, concurrency, mode,
+                        backend, on_lead)
+
+    return asyncio.run(run_until_stopped(stop, _scrape_with_new_browser, keyword, city, limit, concurrency, mode,
+                                         backend, on_lead))
+
+def get_context_options():
+    return {
+        'user_agent': get_random_user_agent(),
+        'viewport': {'width': 1920, 'height': 1080},
+        'locale': 'en-US', # Language English fix karein
+    }
+
+async def run_until_stopped(stop, coro_fn, *args):
+    task = asyncio.ensure_future(coro_fn(*args))
+    if stop is None:
+        return await task
+    while not task.done():
+        if stop.is_set():
+            task.cancel()
+            break
+        await asyncio.wait({task}, timeout=STOP_POLL_INTERVAL)
+    try:
+        return await task
+    except asyncio.CancelledError:
+        logger.info("Scrape stopped before finishing (cancelled or timed out)")
+        return []
+
+async def emit_lead(on_lead, lead):
+    # Callback executor thread me, taaki slow consumer event loop (shared pool) ko na roke
+    if on_lead is not None:
+        await asyncio.get_running_loop().run_in_executor(None, on_lead, lead)
+
+async def _scrape_with_pool(pool, keyword, city, limit, concurrency, mode, backend, on_lead=None):
+    try:
+        async with pool.context(**get_context_options()) as context:
+            return await _scrape_google_maps(context, keyword, city, limit, concurrency, mode, backend, on_lead)
+    except Exception as e:
+        logger.error(f"Critical Error in Maps Scraper: {str(e)}")
+        raise
+
+async def _scrape_with_new_browser(keyword, city, limit, concurrency, mode, backend, on_lead=None):
+    async with async_playwright() as p:
         try:
             # Browser Launch (Headless=True server ke liye)
-            browser = p.chromium.launch(headless=True)
-            context = browser.new_context(
-                user_agent=get_random_user_agent(),
-                viewport={'width': 1920, 'height': 1080},
-                locale='en-US' # Language English fix karein
-            )
-            page = context.new_page()
-            
-            # --- FIX 1: Correct URL Construction ---
-            # Pehle wala URL galat tha, ye standard format hai:
-            query = urllib.parse.quote_plus(f"{keyword} {city}")
-            maps_url = f"https://www.google.com/maps/search/{query}/"
-            
-            logger.info(f"Navigating to: {maps_url}")
-            
-            # --- FIX 2: Wait Logic Change ---
-            # 'networkidle' Google Maps par fail hota hai. 
-            # Hum 'domcontentloaded' use karenge jo fast aur safe hai.
-            page.goto(maps_url, timeout=60000, wait_until="domcontentloaded")
-            
-            # --- FIX 3: Cookie/Consent Popup Handling ---
-            try:
-                # Agar Google "Accept Cookies" mangta hai to click karo
-                if page.locator('button[aria-label="Accept all"]').count() > 0:
-                    page.click('button[aria-label="Accept all"]')
-                    time.sleep(2)
-            except:
-                pass
-
-            # --- FIX 4: Wait for Sidebar Results ---
+            browser = await p.chromium.launch(headless=True)
             try:
-                # Sidebar load hone ka wait (Maximum 15 seconds)
-                page.wait_for_selector('div[role="feed"]', state="visible", timeout=15000)
-                logger.info("Search results loaded.")
-            except Exception as e:
-                logger.error(f"Results list not found. Page title: {page.title()}")
-                # Error dekhne ke liye screenshot lein
-                page.screenshot(path="debug_maps_failed.png")
-                browser.close()
-                return []
-
-            # --- Scrolling Logic ---
-            scrollable_div = page.locator('div[role="feed"]')
-            
-            logger.info("Scrolling to load more results...")
-            for i in range(5): 
-                # Javascript se scroll karein
-                scrollable_div.evaluate("el => el.scrollTop = el.scrollHeight")
-                time.sleep(2) # Data load hone ka wait
-            
-            # --- Link Extraction ---
-            # Maps ke links '/maps/place/' pattern mein hote hain
-            links = page.locator('a[href*="/maps/place/"]').all()
-            
-            place_urls = []
-            for link in links:
-                url = link.get_attribute('href')
-                if url:
-                    clean_url = url.split('?')[0]
-                    if clean_url not in place_urls:
-                        place_urls.append(clean_url)
-                        if len(place_urls) >= limit:
-                            break
-            
-            logger.info(f"Found {len(place_urls)} places. Extracting details...")
-
-            # --- Data Extraction Loop ---
-            for idx, url in enumerate(place_urls):
+                context = await browser.new_context(**get_context_options())
+                return await _scrape_google_maps(context, keyword, city, limit, concurrency, mode, backend, on_lead)
+            finally:
+                await browser.close()
+        except Exception as e:
+            logger.error(f"Critical Error in Maps Scraper: {str(e)}")
+            raise
+
+async def _scrape_google_maps(context, keyword, city, limit, concurrency, mode, backend, on_lead=None):
+    page = await context.new_page()
+
+    payload_places = {}
+    pending_payloads = []
+    if mode == 'feed':
+        page.on('response', lambda response: pending_payloads.append(
+            asyncio.ensure_future(capture_search_payload(response, payload_places))
+        ))
+
+    # --- FIX 1: Correct URL Construction ---
+    # Pehle wala URL galat tha, ye standard format hai:
+    query = urllib.parse.quote_plus(f"{keyword} {city}")
+    maps_url = f"https://www.google.com/maps/search/{query}/"
+
+    logger.info(f"Navigating to: {maps_url}")
+
+    # --- FIX 2: Wait Logic Change ---
+    # 'networkidle' Google Maps par fail hota hai.
+    # Hum 'domcontentloaded' use karenge jo fast aur safe hai.
+    await page.goto(maps_url, timeout=60000, wait_until="domcontentloaded")
+
+    # --- FIX 3: Cookie/Consent Popup Handling ---
+    try:
+        # Agar Google "Accept Cookies" mangta hai to click karo
+        if await page.locator('button[aria-label="Accept all"]').count() > 0:
+            await page.click('button[aria-label="Accept all"]')
+            await asyncio.sleep(2)
+    except:
+        pass
+
+    # --- FIX 4: Wait for Sidebar Results ---
+    try:
+        # Sidebar load hone ka wait (Maximum 15 seconds)
+        await page.wait_for_selector(FEED_SELECTOR, state="visible", timeout=15000)
+        logger.info("Search results loaded.")
+    except Exception as e:
+        title = await page.title()
+        logger.error(f"Results list not found. Page title: {title}")
+        # Error dekhne ke liye screenshot lein
+        await page.screenshot(path="debug_maps_failed.png")
+        raise ScrapeError(f"Google Maps results list not found (page title: {title})") from e
+
+    if mode == 'list':
+        leads = await collect_feed_cards(page, limit, on_lead)
+        logger.info(f"Collected {len(leads)} leads from the results list.")
+        await page.close()
+        return leads
+
+    # --- Scrolling + Link Extraction ---
+    place_urls = await collect_place_urls(page, limit)
+
+    await asyncio.gather(*pending_payloads)
+    await page.close()
+
+    if mode == 'feed':
+        return await build_leads_from_payload(context, place_urls, payload_places, concurrency, backend, on_lead)
+
+    logger.info(f"Found {len(place_urls)} places. Extracting details ({backend} backend)...")
+
+    # --- Data Extraction (parallel pages) ---
+    return await extract_places(context, place_urls, concurrency, backend, on_lead)
+
+async def capture_search_payload(response, payload_places):
+    if not SEARCH_XHR_RE.search(response.url):
+        return
+    try:
+        for place in parse_search_payload(await response.text()):
+            payload_places.setdefault(place['feature_id'], place)
+    except Exception as e:
+        logger.debug(f"Could not parse Maps search payload: {str(e)}")
+
+async def build_leads_from_payload(context, place_urls, payload_places, concurrency, backend, on_lead=None):
+    required_fields = get_maps_settings().feed_required_fields
+
+    leads = []
+    missing = []
+    for idx, url in enumerate(place_urls):
+        match = FEATURE_ID_RE.search(url)
+        lead = payload_places.get(match.group(1)) if match else None
+        if lead:
+            lead = dict(lead, maps_url=url)
+        leads.append(lead)
+        if not lead or any(not lead.get(field) for field in required_fields):
+            missing.append(idx)
+        else:
+            lead.pop('feature_id', None)
+            await emit_lead(on_lead, lead)
+
+    logger.info(f"Feed payload covered {len(place_urls) - len(missing)}/{len(place_urls)} places. "
+                f"Opening {len(missing)} detail pages...")
+
+    if missing:
+        details = await extract_places_ordered(context, [place_urls[idx] for idx in missing], concurrency, backend)
+        for idx, detail in zip(missing, details):
+            if detail and leads[idx] is None:
+                leads[idx] = detail
+            elif detail:
+                for field, value in detail.items():
+                    if value and not leads[idx].get(field):
+                        leads[idx][field] = value
+            # Detail page fail ho to bhi payload wala adhoora lead (batch return ki tarah)
+            if leads[idx] and leads[idx].get('name'):
+                leads[idx].pop('feature_id', None)
+                await emit_lead(on_lead, leads[idx])
+
+    for lead in leads:
+        if lead:
+            lead.pop('feature_id', None)
+
+    return [lead for lead in leads if lead and lead.get('name')]
+
+async def scroll_feed(page, limit, harvest):
+    # Fixed sleep ki jagah feed ke children badhne ka wait karte hain. Ruk jaate
+    # hain jab limit poori ho jaye, list khatam ho jaye, ya feed badhna band ho jaye.
+    # harvest() naye items collect karke ab tak ka total return karta hai.
+    settings = get_maps_settings()
+    timeout_ms = settings.scroll_timeout * 1000
+    feed = page.locator(FEED_SELECTOR)
+    idle_scrolls = 0
+
+    logger.info("Scrolling to load more results...")
+    while True:
+        if await harvest() >= limit:
+            return
+
+        child_count, at_end = await feed.evaluate(
+            "(el, text) => [el.children.length, el.textContent.includes(text)]", END_OF_LIST_TEXT
+        )
+        if at_end:
+            await harvest()
+            logger.info("Reached the end of the results list.")
+            return
+
+        # Javascript se scroll karein
+        await feed.evaluate("el => el.scrollTop = el.scrollHeight")
+        try:
+            await page.wait_for_function(
+                "([selector, count]) => { const el = document.querySelector(selector); return el && el.children.length > count; }",
+                arg=[FEED_SELECTOR, child_count],
+                timeout=timeout_ms
+            )
+            idle_scrolls = 0
+        except Exception:
+            idle_scrolls += 1
+            if idle_scrolls >= settings.max_idle_scrolls:
+                logger.info("Results feed stopped growing.")
+                return
+
+async def collect_place_urls(page, limit):
+    place_urls = []
+    seen = set()
+
+    async def harvest():
+        hrefs = await page.eval_on_selector_all(PLACE_LINK_SELECTOR, "els => els.map(el => el.href)")
+        for url in hrefs:
+            clean_url = url.split('?')[0]
+            if clean_url not in seen:
+                seen.add(clean_url)
+                place_urls.append(clean_url)
+        return len(place_urls)
+
+    await scroll_feed(page, limit, harvest)
+    return place_urls[:limit]
+
+async def collect_feed_cards(page, limit, on_lead=None):
+    # List mode: place page khole bina feed cards se hi leads. Har card ko
+    # padhne ke baad mark kar dete hain, taaki har scroll par sirf naye cards aayein.
+    leads = []
+    seen = set()
+
+    async def harvest():
+        cards = await page.evaluate(EXTRACT_NEW_CARDS_JS, [CARD_SELECTOR, CARD_SEEN_ATTR])
+        for card in cards:
+            lead = parse_feed_card(card)
+            if lead and lead['maps_url'] not in seen and len(leads) < limit:
+                seen.add(lead['maps_url'])
+                leads.append(lead)
+                await emit_lead(on_lead, lead)
+        return len(leads)
+
+    await scroll_feed(page, limit, harvest)
+    return leads[:limit]
+
+async def extract_places(context, place_urls, concurrency=4, backend='playwright', on_lead=None):
+    details = await extract_places_ordered(context, place_urls, concurrency, backend, on_lead)
+    return [data for data in details if data and data.get('name')]
+
+async def extract_places_ordered(context, place_urls, concurrency=4, backend='playwright', on_lead=None):
+    if backend != 'http':
+        return await extract_places_with_pages(context, place_urls, concurrency, on_lead)
+
+    details = await fetch_places_http(place_urls, max(1, get_config().source('google_maps').concurrency), on_lead)
+
+    # Jinka embedded state parse nahi hua, wo browser se
+    fallback = [idx for idx, data in enumerate(details) if not data]
+    if fallback:
+        logger.info(f"HTTP backend parsed {len(place_urls) - len(fallback)}/{len(place_urls)} places. "
+                    f"Falling back to browser for {len(fallback)}...")
+        browser_details = await extract_places_with_pages(context, [place_urls[idx] for idx in fallback], concurrency, on_lead)
+        for idx, data in zip(fallback, browser_details):
+            details[idx] = data
+
+    return details
+
+async def fetch_places_http(place_urls, concurrency, on_lead=None):
+    def fetch_and_emit(url):
+        data = fetch_place_http(url)
+        if data and on_lead is not None:
+            on_lead(data)
+        return data
+
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    try:
+        return list(await asyncio.gather(
+            *(loop.run_in_executor(executor, fetch_and_emit, url) for url in place_urls)
+        ))
+    finally:
+        # Cancel hone par event loop chal rahe fetches ka wait nahi karta, queued wale drop
+        executor.shutdown(wait=False, cancel_futures=True)
+
+def fetch_place_http(url):
+    try:
+        data = parse_place_state(fetch_place_page(url), url)
+        if data:
+            logger.info(f"-> Found: {data['name']}")
+        return data
+    except Exception as e:
+        logger.debug(f"HTTP place fetch failed for {url}: {str(e)}")
+        return None
+
+@retry()
+def fetch_place_page(url):
+    headers = {'Accept-Language': 'en-US,en;q=0.9'}
+    response = fetch(url, source='google_maps', params={'hl': 'en'}, headers=headers, cookies=CONSENT_COOKIES)
+    response.raise_for_status()
+    return response.text
+
+async def extract_places_with_pages(context, place_urls, concurrency=4, on_lead=None):
+    # Har worker ka apna page hota hai, results index ke hisaab se rakhte hain
+    # taaki output order place_urls jaisa hi rahe
+    queue = asyncio.Queue()
+    for idx, url in enumerate(place_urls):
+        queue.put_nowait((idx, url))
+
+    details = [None] * len(place_urls)
+
+    async def worker():
+        page = await context.new_page()
+        try:
+            while True:
+                try:
+                    idx, url = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
                 try:
-                    # Individual Listing Page
-                    page.goto(url, wait_until="domcontentloaded", timeout=30000)
-                    time.sleep(1) # Rendering wait
-                    
-                    data = {
-                        'name': None,
-                        'phone': None,
-                        'website': None,
-                        'address': None,
-                        'maps_url': url,
-                        'source': 'Google Maps'
-                    }
-
-                    # Name (H1 tag usually contains the name)
-                    if page.locator('h1').count() > 0:
-                        data['name'] = page.locator('h1').first.inner_text()
-
-                    # Phone (Button with data-item-id phone)
-                    phone_btn = page.locator('button[data-item-id*="phone:tel:"]')
-                    if phone_btn.count() > 0:
-                        data['phone'] = phone_btn.first.get_attribute('data-item-id').replace('phone:tel:', '')
-
-                    # Website (Button with data-item-id authority)
-                    web_btn = page.locator('a[data-item-id="authority"]')
-                    if web_btn.count() > 0:
-                        data['website'] = web_btn.first.get_attribute('href')
-                    
-                    # Address (Button with data-item-id address)
-                    addr_btn = page.locator('button[data-item-id="address"]')
-                    if addr_btn.count() > 0:
-                        data['address'] = addr_btn.first.get_attribute('aria-label').replace('Address: ', '')
-
-                    if data['name']:
-                        print(f"-> Found: {data['name']}")
-                        results.append(data)
-                
+                    details[idx] = await extract_place_details(page, url)
                 except Exception as e:
-                    print(f"Skipping a place due to error: {e}")
+                    logger.warning(f"Skipping a place due to error: {e}")
                     continue
+                if details[idx] and details[idx].get('name'):
+                    await emit_lead(on_lead, details[idx])
+        finally:
+            await page.close()
+
+    workers = min(concurrency, len(place_urls))
+    await asyncio.gather(*(worker() for _ in range(workers)))
+
+    return details
+
+@retry()
+async def extract_place_details(page, url):
+    # Individual Listing Page
+    await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+    await page.wait_for_selector('h1', timeout=10000) # Rendering wait
+
+    # Saare fields ek hi evaluate call me (har locator call ek alag round trip hota hai)
+    raw = await page.evaluate(EXTRACT_PLACE_JS, PLACE_FIELDS)
+
+    data = {
+        'name': raw.get('name'),
+        'phone': raw.get('phone'),
+        'website': raw.get('website'),
+        'address': raw.get('address'),
+        'rating': parse_rating(raw.get('rating')),
+        'category': raw.get('category'),
+        'latitude': None,
+        'longitude': None,
+        'maps_url': url,
+        'source': 'Google Maps'
+    }
+    data['latitude'], data['longitude'] = parse_coordinates(raw.get('url') or url)
+
+    if data['name']:
+        logger.info(f"-> Found: {data['name']}")
+
+    return data
 
-            browser.close()
-            
-        except Exception as e:
-            logger.error(f"Critical Error in Maps Scraper: {str(e)}")
-            
-    return results
\ No newline at end of file
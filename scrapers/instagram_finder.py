@@ -1,68 +1,164 @@
 import re
-import requests
+import threading
 from bs4 import BeautifulSoup
 from urllib.parse import urlparse, unquote
+from cleaner import website_domain
+from utils.config import get_config
+from utils.http_client import fetch
+from utils.http_cache import get_cache_mode
+from utils.result_cache import ResultCache
 from utils.logger import logger
-from utils.proxies import get_random_user_agent
 from utils.retryer import retry
-import time
+
+NAME_KEY_RE = re.compile(r'[^\W_]+')
+
+RESERVED_PATHS = {'share', 'p', 'reel', 'tv', 'explore', 'accounts'}
+INSTAGRAM_HREF_RE = re.compile(
+    rb'''href\s*=\s*["']?(?:https?:)?//(?:www\.)?instagram\.com/([a-zA-Z0-9._]+)/?(?=["'?#\s>])''', re.IGNORECASE
+)
+INSTAGRAM_TEXT_RE = re.compile(rb'instagram\.com/([a-zA-Z0-9._]+)')
+INSTAGRAM_MENTION_RE = re.compile(rb'instagram', re.IGNORECASE)
+INSTAGRAM_LINK_RE = re.compile(r'instagram\.com/[^/]+/?$')
+SCAN_OVERLAP = 256
+
+_cache = None
+_cache_lock = threading.Lock()
+
+def get_instagram_cache():
+    global _cache
+    if get_cache_mode() == 'off' or not get_config().instagram_cache.enabled:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResultCache(get_config().instagram_cache.path)
+            _cache.purge()
+        return _cache
 
 def find_instagram(business_name, website=None):
     logger.info(f"Finding Instagram for: {business_name}")
     
-    if website:
-        instagram_url = extract_instagram_from_website(website)
+    # Website ka result domain par, Google search ka result naam par cache hota hai,
+    # "nahi mila" bhi (alag TTL ke saath) taaki agle runs dono steps skip kar sakein.
+    # Enrichment website ko scrapers/website_contacts.py se padhta hai aur yahan sirf naam deta hai
+    domain = website_domain(website)
+    if domain:
+        instagram_url = cached_lookup(f'site:{domain}', lookup_website_instagram, website)
         if instagram_url:
             return instagram_url
     
-    instagram_url = search_google_for_instagram(business_name)
+    name_key = ' '.join(NAME_KEY_RE.findall((business_name or '').lower()))
+    if not name_key:
+        return None
+    return cached_lookup(f'name:{name_key}', lookup_google_instagram, business_name)
+
+def cached_lookup(key, lookup, arg):
+    cache = get_instagram_cache()
+    if cache and get_cache_mode() == 'use':
+        found, instagram_url = cache.get(key)
+        if found:
+            return instagram_url
+    
+    instagram_url, complete = lookup(arg)
+    # Fetch fail hua ho to "nahi mila" pakka nahi hai, use cache nahi karte
+    if cache and complete:
+        settings = get_config().instagram_cache
+        cache.set(key, instagram_url, settings.hit_ttl if instagram_url else settings.miss_ttl)
     return instagram_url
 
 @retry()
-def fetch_website_content(website):
+def scan_website(website):
     if not website.startswith('http'):
         website = 'https://' + website
     
-    headers = {'User-Agent': get_random_user_agent()}
-    return requests.get(website, headers=headers, timeout=10, allow_redirects=True)
+    # Har attempt ka apna scanner, taaki fail hue attempt ka adhoora state na rahe
+    scanner = InstagramScanner()
+    response = fetch(website, source='websites', max_bytes=get_config().enrichment.website_max_bytes,
+                     on_chunk=scanner.feed)
+    return response, scanner
 
 def extract_instagram_from_website(website):
+    return lookup_website_instagram(website)[0]
+
+def lookup_website_instagram(website):
+    # (instagram_url, complete) - complete tabhi jab page sach me padha gaya
     try:
-        response = fetch_website_content(website)
+        response, scanner = scan_website(website)
         
         if response.status_code == 200:
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            instagram_links = soup.find_all('a', href=re.compile(r'instagram\.com/[^/]+/?$'))
-            
-            for link in instagram_links:
-                href = link.get('href')
-                if href and 'instagram.com/' in href:
-                    instagram_url = clean_instagram_url(href)
-                    if instagram_url:
-                        logger.info(f"Found Instagram from website: {instagram_url}")
-                        return instagram_url
-            
-            text_content = response.text
-            instagram_match = re.search(r'instagram\.com/([a-zA-Z0-9._]+)/?', text_content)
-            if instagram_match:
-                username = instagram_match.group(1)
-                if username not in ['share', 'p', 'reel', 'tv', 'explore', 'accounts']:
-                    instagram_url = f"https://www.instagram.com/{username}/"
-                    logger.info(f"Found Instagram in content: {instagram_url}")
-                    return instagram_url
+            instagram_url = scanner.finish(response.content)
+            if instagram_url:
+                logger.info(f"Found Instagram from website: {instagram_url}")
+            return instagram_url, True
     
     except Exception as e:
         logger.error(f"Error extracting Instagram from website: {str(e)}")
     
+    return None, False
+
+# Body ko chunks me aate hi scan karta hai. Profile wala <a href> milte hi download
+# ruk jaata hai; warna poori body ke baad text match, aur wo bhi na mile par
+# 'instagram' likha ho tabhi BeautifulSoup se parse (entities wale hrefs ke liye).
+class InstagramScanner:
+    def __init__(self):
+        self.instagram_url = None
+        self.text_handle = None
+        self.mentioned = False
+        self._tail = b''
+
+    def feed(self, chunk):
+        data = self._tail + chunk
+        for match in INSTAGRAM_HREF_RE.finditer(data):
+            handle = match.group(1).decode('ascii')
+            if handle not in RESERVED_PATHS:
+                self.instagram_url = f"https://www.instagram.com/{handle}/"
+                return True
+        
+        if self.text_handle is None:
+            self.text_handle = first_text_handle(data, partial=True)
+        if not self.mentioned:
+            self.mentioned = INSTAGRAM_MENTION_RE.search(data) is not None
+        
+        # Chunk ke boundary par kata hua link agle chunk me poora mil jaye
+        self._tail = data[-SCAN_OVERLAP:]
+        return False
+
+    def finish(self, body):
+        if self.instagram_url:
+            return self.instagram_url
+        if self.text_handle is None:
+            self.text_handle = first_text_handle(self._tail)
+        if self.text_handle:
+            return f"https://www.instagram.com/{self.text_handle}/"
+        if self.mentioned:
+            return parse_instagram_links(body)
+        return None
+
+def first_text_handle(data, partial=False):
+    for match in INSTAGRAM_TEXT_RE.finditer(data):
+        # Data ke end tak pahuncha handle agle chunk me aage badh sakta hai
+        if partial and match.end(1) == len(data):
+            break
+        handle = match.group(1).decode('ascii')
+        if handle not in RESERVED_PATHS:
+            return handle
+    return None
+
+def parse_instagram_links(html):
+    soup = BeautifulSoup(html, 'html.parser')
+    for link in soup.find_all('a', href=INSTAGRAM_LINK_RE):
+        instagram_url = clean_instagram_url(link['href'])
+        if instagram_url:
+            return instagram_url
     return None
 
 @retry()
 def fetch_google_search(search_url):
-    headers = {'User-Agent': get_random_user_agent()}
-    return requests.get(search_url, headers=headers, timeout=10)
+    return fetch(search_url, source='google_search')
 
 def search_google_for_instagram(business_name):
+    return lookup_google_instagram(business_name)[0]
+
+def lookup_google_instagram(business_name):
     try:
         search_query = f"{business_name} Instagram".replace(' ', '+')
         search_url = f"https://www.google.com/search?q={search_query}"
@@ -85,20 +181,20 @@ def search_google_for_instagram(business_name):
                             instagram_url = clean_instagram_url(url)
                             if instagram_url:
                                 logger.info(f"Found Instagram via Google: {instagram_url}")
-                                return instagram_url
+                                return instagram_url, True
                 
                 elif 'instagram.com/' in href:
                     instagram_url = clean_instagram_url(href)
                     if instagram_url:
                         logger.info(f"Found Instagram via Google: {instagram_url}")
-                        return instagram_url
-        
-        time.sleep(0.5)
+                        return instagram_url, True
+            
+            return None, True
     
     except Exception as e:
         logger.error(f"Error searching Google for Instagram: {str(e)}")
     
-    return None
+    return None, False
 
 def clean_instagram_url(url):
     try:
@@ -109,7 +205,7 @@ def clean_instagram_url(url):
         if match:
             username = match.group(1)
             
-            if username in ['p', 'reel', 'tv', 'explore', 'accounts', 'share']:
+            if username in RESERVED_PATHS:
                 return None
             
             return f"https://www.instagram.com/{username}/"
@@ -1,105 +1,249 @@
-import time
-import requests
-from bs4 import BeautifulSoup
+import asyncio
+import urllib.parse
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from playwright.async_api import async_playwright
+from scrapers.google_maps import ScrapeError, get_context_options, emit_lead, run_until_stopped
+from scrapers.justdial_parser import PHONE_TEXT_RE, find_listings, extract_justdial_lead
+from utils.config import get_config
+from utils.http_client import fetch
 from utils.logger import logger
-from utils.proxies import get_random_user_agent, get_random_delay
 from utils.retryer import retry
-import re
 
 @retry()
 def fetch_justdial_page(url):
     headers = {
-        'User-Agent': get_random_user_agent(),
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
         'Accept-Language': 'en-US,en;q=0.5',
-        'Accept-Encoding': 'gzip, deflate, br',
-        'Connection': 'keep-alive',
         'Upgrade-Insecure-Requests': '1',
     }
-    response = requests.get(url, headers=headers, timeout=15)
+    response = fetch(url, source='justdial', headers=headers)
     response.raise_for_status()
     return response.text
 
-def scrape_justdial(keyword, city, limit=50):
+JUSTDIAL_SEARCH_URL = "https://www.justdial.com/search"
+JUSTDIAL_BASE_URL = "https://www.justdial.com"
+
+# http = search pages requests se (parallel pages), browser = listing page headless
+# Playwright me scroll karke (JustDial HTML band kare tab ke liye)
+JUSTDIAL_MODES = ('http', 'browser')
+
+CARD_SELECTORS = ('.resultbox', 'div[data-href]')
+CARD_SEEN_ATTR = 'data-leadgen-seen'
+
+# Sirf wo cards jo pichhli baar nahi padhe; padhte hi mark ho jaate hain
+EXTRACT_NEW_CARDS_JS = """
+([selectors, seenAttr]) => {
+    const selector = selectors.find(sel => document.querySelector(sel)) || selectors[0];
+    return Array.from(document.querySelectorAll(`${selector}:not([${seenAttr}])`)).map(card => {
+        card.setAttribute(seenAttr, '1');
+        const title = card.querySelector('.resultbox_title_anchor') || card.querySelector('h2, h3');
+        const tel = card.querySelector('a[href^="tel:"]');
+        const phone = card.querySelector('[class*="callcontent"], [class*="phone"]');
+        const address = card.querySelector('[class*="address"], [class*="locatcity"]');
+        const website = Array.from(card.querySelectorAll('a[href]'))
+            .map(a => a.href)
+            .find(href => href.startsWith('http') && !href.includes('justdial'));
+        return {
+            name: title ? title.innerText : null,
+            phone: tel ? tel.getAttribute('href').replace('tel:', '') : (phone ? phone.innerText : null),
+            address: address ? address.innerText : null,
+            website: website || null,
+        };
+    });
+}
+"""
+
+COUNT_CARDS_JS = "(selectors) => Math.max(...selectors.map(sel => document.querySelectorAll(sel).length))"
+
+def search_url(keyword, city, page=1):
+    search_query = f"{keyword} {city}".replace(' ', '+')
+    url = f"{JUSTDIAL_SEARCH_URL}?query={search_query}"
+    return url if page == 1 else f"{url}&page={page}"
+
+def lead_key(lead):
+    return (lead['name'].strip().lower(), lead.get('phone'))
+
+def scrape_justdial(keyword, city, limit=50, mode=None, pool=None, on_lead=None, stop=None):
     logger.info(f"Starting JustDial scraper for '{keyword}' in '{city}'")
+    
+    if mode is None:
+        mode = get_config().justdial.mode
+    if mode == 'browser':
+        # Server (app.py) shared pool deta hai, CLI apna browser khud launch karta hai
+        if pool is not None:
+            results = pool.run(run_until_stopped, stop, _scrape_browser_with_pool, pool, keyword, city, limit, on_lead)
+        else:
+            results = asyncio.run(run_until_stopped(stop, _scrape_browser_with_new_browser, keyword, city, limit, on_lead))
+        logger.info(f"JustDial scraping complete. Found {len(results)} leads")
+        return results
+    
     results = []
     
     try:
-        search_query = f"{keyword} {city}".replace(' ', '+')
-        justdial_url = f"https://www.justdial.com/search?query={search_query}"
-        
-        logger.info(f"Fetching JustDial: {justdial_url}")
-        html_content = fetch_justdial_page(justdial_url)
-        time.sleep(get_random_delay())
-        
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
-        listings = soup.find_all(['li', 'div'], class_=re.compile(r'.*result.*|.*listing.*|.*card.*', re.I))[:limit*2]
-        
-        logger.info(f"Found {len(listings)} potential listings")
-        
-        for idx, listing in enumerate(listings[:limit]):
-            try:
-                lead = extract_justdial_lead(listing)
-                if lead and lead.get('name'):
-                    results.append(lead)
-                    logger.info(f"Extracted lead {len(results)}: {lead.get('name')}")
-                if len(results) >= limit:
-                    break
-            except Exception as e:
-                logger.error(f"Error extracting listing {idx}: {str(e)}")
-                continue
-        
+        for lead in iter_justdial(keyword, city, limit, stop):
+            results.append(lead)
+            logger.info(f"Extracted lead {len(results)}: {lead.get('name')}")
+            if on_lead is not None:
+                on_lead(lead)
     except Exception as e:
-        logger.error(f"JustDial scraper error: {str(e)}")
+        # Ab tak ke leads on_lead se ja chuke; source phir bhi 'error' gina jaata hai
+        logger.error(f"JustDial scraper error after {len(results)} leads: {str(e)}")
+        raise
     
     logger.info(f"JustDial scraping complete. Found {len(results)} leads")
     return results
 
-def extract_justdial_lead(listing):
-    lead = {
-        'name': None,
-        'phone': None,
-        'website': None,
-        'address': None,
-        'maps_url': None,
-        'source': 'JustDial'
-    }
-    
+def iter_justdial(keyword, city, limit=50, stop=None):
+    # Pages justdial ke rate-limited slots se parallel aate hain, par leads page ke order
+    # me hi yield hote hain. Pehle page se pata chalta hai ek page me kitne leads hain,
+    # usi se aage kitne pages ek saath mangwane hain. limit pura hote hi (ya stop set
+    # hote hi) baaki cancel.
+    config = get_config()
+    concurrency = max(1, config.source('justdial').concurrency)
+    max_pages = config.justdial.max_pages
+
+    seen = set()
+    per_page = None
+    next_page = 1
+    pending = deque()
+    executor = ThreadPoolExecutor(max_workers=concurrency)
     try:
-        name_elem = listing.find(['h2', 'h3', 'span', 'a'], class_=re.compile(r'.*name.*|.*title.*|.*business.*', re.I))
-        if name_elem:
-            lead['name'] = name_elem.get_text(strip=True)
-    except Exception:
-        pass
+        while stop is None or not stop.is_set():
+            remaining = limit - len(seen)
+            window = 1 if per_page is None else min(concurrency, -(-remaining // per_page))
+            while len(pending) < window and next_page <= max_pages:
+                url = search_url(keyword, city, next_page)
+                logger.info(f"Fetching JustDial: {url}")
+                pending.append((next_page, executor.submit(fetch_listings, url)))
+                next_page += 1
+            if not pending:
+                break
+
+            page, future = pending.popleft()
+            try:
+                leads = future.result()
+            except Exception as e:
+                raise ScrapeError(f"JustDial page {page} failed: {str(e)}") from e
+
+            # Khali page ya sirf pehle dekhe hue leads = results khatam
+            new_leads = [lead for lead in leads if lead_key(lead) not in seen]
+            logger.info(f"JustDial page {page}: {len(leads)} listings, {len(new_leads)} new")
+            if not new_leads:
+                break
+            per_page = per_page or len(leads)
+
+            for lead in new_leads:
+                key = lead_key(lead)
+                if key in seen:
+                    continue
+                seen.add(key)
+                yield lead
+                if len(seen) >= limit:
+                    return
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+def fetch_listings(url):
+    html_content = fetch_justdial_page(url)
+    listings = find_listings(html_content)
     
+    leads = []
+    for idx, listing in enumerate(listings):
+        try:
+            lead = extract_justdial_lead(listing)
+            if lead and lead.get('name'):
+                leads.append(lead)
+        except Exception as e:
+            logger.error(f"Error extracting listing {idx}: {str(e)}")
+    return leads
+
+def listing_url(keyword, city):
+    path = '/'.join(urllib.parse.quote(part.strip().replace(' ', '-')) for part in (city, keyword))
+    return f"{JUSTDIAL_BASE_URL}/{path}"
+
+async def _scrape_browser_with_pool(pool, keyword, city, limit, on_lead=None):
     try:
-        phone_elem = listing.find(['span', 'a', 'p'], class_=re.compile(r'.*phone.*|.*mobile.*|.*contact.*', re.I))
-        if phone_elem:
-            phone_text = phone_elem.get_text(strip=True)
-            phone_match = re.search(r'[\d\s\-\+\(\)]{10,}', phone_text)
-            if phone_match:
-                lead['phone'] = phone_match.group().strip()
-        
-        if not lead['phone']:
-            phone_link = listing.find('a', href=re.compile(r'^tel:'))
-            if phone_link:
-                lead['phone'] = phone_link['href'].replace('tel:', '').strip()
-    except Exception:
-        pass
+        async with pool.context(**get_context_options()) as context:
+            return await _scrape_justdial_browser(context, keyword, city, limit, on_lead)
+    except Exception as e:
+        logger.error(f"JustDial browser scraper error: {str(e)}")
+        raise
+
+async def _scrape_browser_with_new_browser(keyword, city, limit, on_lead=None):
+    async with async_playwright() as p:
+        try:
+            browser = await p.chromium.launch(headless=True)
+            try:
+                context = await browser.new_context(**get_context_options())
+                return await _scrape_justdial_browser(context, keyword, city, limit, on_lead)
+            finally:
+                await browser.close()
+        except Exception as e:
+            logger.error(f"JustDial browser scraper error: {str(e)}")
+            raise
+
+async def _scrape_justdial_browser(context, keyword, city, limit, on_lead=None):
+    settings = get_config().justdial
+    timeout_ms = settings.scroll_timeout * 1000
+    page = await context.new_page()
     
-    try:
-        address_elem = listing.find(['span', 'p', 'div'], class_=re.compile(r'.*address.*|.*location.*', re.I))
-        if address_elem:
-            lead['address'] = address_elem.get_text(strip=True)
-    except Exception:
-        pass
+    url = listing_url(keyword, city)
+    logger.info(f"Opening JustDial: {url}")
+    await page.goto(url, timeout=60000, wait_until="domcontentloaded")
     
     try:
-        website_elem = listing.find('a', class_=re.compile(r'.*website.*|.*web.*', re.I))
-        if website_elem and website_elem.get('href'):
-            lead['website'] = website_elem['href']
+        await page.wait_for_selector(', '.join(CARD_SELECTORS), timeout=15000)
     except Exception:
-        pass
+        title = await page.title()
+        logger.error(f"JustDial results not found. Page title: {title}")
+        await page.close()
+        raise ScrapeError(f"JustDial results not found (page title: {title})")
+    
+    leads = []
+    seen_names = set()
+    idle_scrolls = 0
     
-    return lead if lead.get('name') else None
+    # Har scroll ke baad sirf naye cards padhte hain, aur fixed sleep ki jagah
+    # cards ki ginti badhne ka wait
+    while True:
+        for card in await page.evaluate(EXTRACT_NEW_CARDS_JS, [list(CARD_SELECTORS), CARD_SEEN_ATTR]):
+            lead = parse_browser_card(card)
+            if lead and lead['name'] not in seen_names and len(leads) < limit:
+                seen_names.add(lead['name'])
+                leads.append(lead)
+                await emit_lead(on_lead, lead)
+        if len(leads) >= limit:
+            break
+        
+        card_count = await page.evaluate(COUNT_CARDS_JS, list(CARD_SELECTORS))
+        await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+        try:
+            await page.wait_for_function(
+                f"([selectors, count]) => ({COUNT_CARDS_JS})(selectors) > count",
+                arg=[list(CARD_SELECTORS), card_count],
+                timeout=timeout_ms
+            )
+            idle_scrolls = 0
+        except Exception:
+            idle_scrolls += 1
+            if idle_scrolls >= settings.max_idle_scrolls:
+                logger.info("JustDial list stopped growing.")
+                break
+    
+    await page.close()
+    return leads[:limit]
+
+def parse_browser_card(card):
+    name = (card.get('name') or '').strip()
+    if not name:
+        return None
+    phone_match = PHONE_TEXT_RE.search(card.get('phone') or '')
+    return {
+        'name': name,
+        'phone': phone_match.group().strip() if phone_match else None,
+        'website': card.get('website'),
+        'address': (card.get('address') or '').strip() or None,
+        'maps_url': None,
+        'source': 'JustDial'
+    }
@@ -0,0 +1,98 @@
+import re
+from bs4 import BeautifulSoup, SoupStrainer
+
+# JustDial search page ke pure parsers (network ki zaroorat nahi), saved HTML par offline chal sakte hain
+
+try:
+    import lxml # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+LISTING_TAGS = ('li', 'div')
+LISTING_CLASS_RE = re.compile(r'result|listing|card', re.I)
+
+# field -> (tags, class regex); har card par ek hi pass me pehla matching tag
+FIELD_SELECTORS = {
+    'name': (('h2', 'h3', 'span', 'a'), re.compile(r'name|title|business', re.I)),
+    'phone': (('span', 'a', 'p'), re.compile(r'phone|mobile|contact', re.I)),
+    'address': (('span', 'p', 'div'), re.compile(r'address|location', re.I)),
+    'website': (('a',), re.compile(r'website|web', re.I)),
+}
+PHONE_TEXT_RE = re.compile(r'[\d\s\-\+\(\)]{10,}')
+
+# Pehle card se pehle ka hissa (head, scripts, nav) tokenize hi nahi hota, aur baaki me
+# sirf listing cards ka tree banta hai. <script>/<style>/comments ke andar ke
+# '<div class="card-body">' jaise template strings card nahi maane jaate (warna parse
+# script ke beech se shuru hota aur ek nakli card asli cards nigal leta)
+LISTING_START_RE = re.compile(r'''<(?:li|div)\b[^>]*?\bclass\s*=\s*["']?[^"'>]*(?:result|listing|card)''', re.I)
+SKIP_BLOCK_RE = re.compile(r'<(?:(script|style)\b|!--)', re.I)
+BLOCK_END_RES = {
+    'script': re.compile(r'</script\s*>', re.I),
+    'style': re.compile(r'</style\s*>', re.I),
+    None: re.compile(r'-->'),
+}
+LISTING_STRAINER = SoupStrainer(LISTING_TAGS, class_=LISTING_CLASS_RE)
+
+def listing_start(html):
+    pos = 0
+    while True:
+        card = LISTING_START_RE.search(html, pos)
+        if card is None:
+            return None
+        block = SKIP_BLOCK_RE.search(html, pos, card.start())
+        if block is None:
+            return card.start()
+        block_end = BLOCK_END_RES[block.group(1) and block.group(1).lower()].search(html, block.end())
+        if block_end is None:
+            return None
+        pos = block_end.end()
+
+def find_listings(html):
+    start = listing_start(html)
+    if start is None:
+        return []
+    soup = BeautifulSoup(html[start:], HTML_PARSER, parse_only=LISTING_STRAINER)
+    return soup.find_all(LISTING_TAGS, class_=LISTING_CLASS_RE)
+
+def extract_justdial_lead(listing):
+    lead = {
+        'name': None,
+        'phone': None,
+        'website': None,
+        'address': None,
+        'maps_url': None,
+        'source': 'JustDial'
+    }
+
+    elements = {}
+    tel_link = None
+    for tag in listing.find_all(True):
+        classes = tag.get('class')
+        class_text = ' '.join(classes) if isinstance(classes, list) else classes
+        if class_text:
+            for field, (tags, class_re) in FIELD_SELECTORS.items():
+                if field not in elements and tag.name in tags and class_re.search(class_text):
+                    elements[field] = tag
+        if tel_link is None and tag.name == 'a' and (tag.get('href') or '').startswith('tel:'):
+            tel_link = tag
+        if tel_link is not None and len(elements) == len(FIELD_SELECTORS):
+            break
+
+    if 'name' in elements:
+        lead['name'] = elements['name'].get_text(strip=True)
+
+    if 'phone' in elements:
+        phone_match = PHONE_TEXT_RE.search(elements['phone'].get_text(strip=True))
+        if phone_match:
+            lead['phone'] = phone_match.group().strip()
+    if not lead['phone'] and tel_link is not None:
+        lead['phone'] = tel_link['href'].replace('tel:', '').strip()
+
+    if 'address' in elements:
+        lead['address'] = elements['address'].get_text(strip=True)
+
+    if 'website' in elements and elements['website'].get('href'):
+        lead['website'] = elements['website']['href']
+
+    return lead if lead.get('name') else None
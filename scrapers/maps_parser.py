@@ -0,0 +1,126 @@
+import json
+import re
+
+# Google Maps ke data ko parse karne wale pure functions (browser ki zaroorat nahi),
+# taaki recorded payloads/HTML par offline chal sakein
+
+CARD_PHONE_RE = re.compile(r'((\+91|0)?[ -]?[6-9][0-9]{4}[ -]?[0-9]{5})')
+COORDS_PIN_RE = re.compile(r'!3d(-?\d+\.\d+)!4d(-?\d+\.\d+)')
+COORDS_VIEWPORT_RE = re.compile(r'@(-?\d+\.\d+),(-?\d+\.\d+)')
+FEATURE_ID_RE = re.compile(r'!1s(0x[0-9a-f]+:0x[0-9a-f]+)')
+
+# Place page ki initial HTML me poora state is script variable me hota hai
+APP_STATE_MARKER = 'window.APP_INITIALIZATION_STATE='
+XSSI_PREFIX = ")]}'"
+
+# Search payload aur place page state, dono me place array ka layout same hai
+PAYLOAD_FIELDS = {
+    'name': (11,),
+    'phone': (178, 0, 0),
+    'website': (7, 0),
+    'address': (39,),
+    'rating': (4, 7),
+    'category': (13, 0),
+    'latitude': (9, 2),
+    'longitude': (9, 3),
+    'feature_id': (10,),
+}
+
+def parse_search_payload(text):
+    data = load_maps_json(text)
+    places = []
+    for entry in dig(data, 0, 1) or []:
+        place = dig(entry, 14)
+        if not isinstance(place, list):
+            continue
+        lead = parse_place_array(place)
+        if lead['name'] and lead['feature_id']:
+            places.append(lead)
+    return places
+
+def parse_place_state(html, url):
+    # JSON ka end dhundne ke liye raw_decode use karte hain, DOM parse ki zaroorat nahi
+    start = html.find(APP_STATE_MARKER)
+    if start == -1:
+        return None
+    start += len(APP_STATE_MARKER)
+
+    state, _ = json.JSONDecoder().raw_decode(html, start)
+    blob = dig(state, 3, 6)
+    if not isinstance(blob, str):
+        return None
+
+    place = dig(load_maps_json(blob), 6)
+    if not isinstance(place, list):
+        return None
+
+    lead = parse_place_array(place)
+    if not lead['name']:
+        return None
+
+    lead.pop('feature_id', None)
+    lead['maps_url'] = url
+    if lead['latitude'] is None:
+        lead['latitude'], lead['longitude'] = parse_coordinates(url)
+    return lead
+
+def parse_place_array(place):
+    lead = {field: dig(place, *path) for field, path in PAYLOAD_FIELDS.items()}
+    lead['source'] = 'Google Maps'
+    return lead
+
+def load_maps_json(text):
+    # Body {"c":0,"d":")]}'\n[...]"}/*""*/ jaisi hoti hai, andar wala JSON chahiye
+    text = text.strip()
+    if text.endswith('/*""*/'):
+        text = text[:-len('/*""*/')]
+    if text.startswith('{'):
+        text = json.loads(text).get('d', '')
+    if text.startswith(XSSI_PREFIX):
+        text = text[len(XSSI_PREFIX):]
+    return json.loads(text)
+
+def dig(data, *path):
+    for key in path:
+        try:
+            data = data[key]
+        except (IndexError, KeyError, TypeError):
+            return None
+    return data
+
+def parse_feed_card(card):
+    if not card.get('name') or not card.get('url'):
+        return None
+
+    maps_url = card['url'].split('?')[0]
+    phone_match = CARD_PHONE_RE.search(card.get('text') or '')
+    rating_match = re.search(r'\d+(?:[.,]\d+)?', card.get('rating') or '')
+    latitude, longitude = parse_coordinates(card['url'])
+
+    return {
+        'name': card['name'].strip(),
+        'phone': phone_match.group(0).strip() if phone_match else None,
+        'website': card.get('website'),
+        'address': None,
+        'rating': parse_rating(rating_match.group(0)) if rating_match else None,
+        'category': None,
+        'latitude': latitude,
+        'longitude': longitude,
+        'maps_url': maps_url,
+        'source': 'Google Maps'
+    }
+
+def parse_rating(rating):
+    if not rating:
+        return None
+    try:
+        return float(rating.replace(',', '.'))
+    except ValueError:
+        return None
+
+def parse_coordinates(url):
+    # Place URL me pin ke coordinates '!3d<lat>!4d<lng>' ya '@<lat>,<lng>' me hote hain
+    match = COORDS_PIN_RE.search(url) or COORDS_VIEWPORT_RE.search(url)
+    if match:
+        return float(match.group(1)), float(match.group(2))
+    return None, None
@@ -0,0 +1,169 @@
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urljoin
+from cleaner import website_domain
+from scrapers.instagram_finder import InstagramScanner, get_instagram_cache, SCAN_OVERLAP
+from utils.config import get_config
+from utils.http_cache import get_cache_mode
+from utils.http_client import fetch
+from utils.logger import logger
+from utils.retryer import retry
+
+CONTACT_FIELDS = ('instagram', 'email', 'facebook', 'linkedin', 'whatsapp')
+
+# Lookbehind se match sirf local part ke shuru se try hota hai; bina iske '@' na milne par
+# har word ke har character se dobara try hota tha (bade pages par sabse mehenga pattern)
+EMAIL_RE = re.compile(rb'(?<![a-zA-Z0-9._%+-])[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+FACEBOOK_RE = re.compile(rb'facebook\.com/([a-zA-Z0-9.\-]+)', re.IGNORECASE)
+LINKEDIN_RE = re.compile(rb'linkedin\.com/(company|in)/([a-zA-Z0-9_\-%.]+)', re.IGNORECASE)
+WHATSAPP_RE = re.compile(rb'(?:wa\.me/|whatsapp\.com/send/?\?phone=|whatsapp://send\?phone=)(?:%2B|\+)?(\d{8,15})', re.IGNORECASE)
+
+# Image names, tracker addresses wagarah email jaise dikhte hain par kaam ke nahi
+JUNK_EMAIL_SUFFIXES = ('.png', '.jpg', '.jpeg', '.gif', '.webp', '.svg', 'wix.com', 'sentry.io', 'example.com')
+FACEBOOK_RESERVED = {
+    'sharer', 'sharer.php', 'share', 'share.php', 'plugins', 'tr', 'dialog', 'login',
+    'policy.php', 'profile.php', 'pages', 'groups', '2008', # xmlns:fb="http://www.facebook.com/2008/fbml"
+}
+
+def build_email(match):
+    email = match.group(0).decode('ascii')
+    if email.lower().endswith(JUNK_EMAIL_SUFFIXES):
+        return None
+    return email
+
+def build_facebook(match):
+    page = match.group(1).decode('ascii').rstrip('.')
+    if not page or page.lower() in FACEBOOK_RESERVED:
+        return None
+    return f"https://www.facebook.com/{page}/"
+
+def build_linkedin(match):
+    return f"https://www.linkedin.com/{match.group(1).decode('ascii').lower()}/{match.group(2).decode('ascii')}/"
+
+def build_whatsapp(match):
+    return f"https://wa.me/{match.group(1).decode('ascii')}"
+
+FIELD_PATTERNS = {
+    'email': (EMAIL_RE, build_email),
+    'facebook': (FACEBOOK_RE, build_facebook),
+    'linkedin': (LINKEDIN_RE, build_linkedin),
+    'whatsapp': (WHATSAPP_RE, build_whatsapp),
+}
+
+def empty_contacts():
+    return {field: None for field in CONTACT_FIELDS}
+
+def first_match(pattern, build, data, partial=False):
+    for match in pattern.finditer(data):
+        # End ke paas wala match agle chunk me aage badh sakta hai, aur backtracking se wo
+        # end se pehle bhi ruk sakta hai ('info@clinic.co' + '.in'). Aise matches agle
+        # chunk ke overlap me phir se milte hain
+        if partial and match.end() > len(data) - SCAN_OVERLAP:
+            break
+        value = build(match)
+        if value:
+            return value
+    return None
+
+# Ek hi body par saare extractors; sab fields mil jayein (ya stop set ho) to download ruk jaata hai
+class ContactScanner:
+    def __init__(self, stop=None):
+        self.stop = stop
+        self.instagram = InstagramScanner()
+        self.instagram_done = False
+        self.found = {}
+        self._tail = b''
+
+    def feed(self, chunk):
+        if self.stop is not None and self.stop.is_set():
+            return True
+
+        data = self._tail + chunk
+        for field, (pattern, build) in FIELD_PATTERNS.items():
+            if field not in self.found:
+                value = first_match(pattern, build, data, partial=True)
+                if value:
+                    self.found[field] = value
+        # Tail overlap se double: chhoda gaya match tail ke andar poora shuru ho
+        self._tail = data[-2 * SCAN_OVERLAP:]
+
+        if not self.instagram_done:
+            self.instagram_done = self.instagram.feed(chunk)
+        return self.instagram_done and len(self.found) == len(FIELD_PATTERNS)
+
+    def finish(self, body):
+        contacts = empty_contacts()
+        contacts['instagram'] = self.instagram.finish(body)
+        for field, (pattern, build) in FIELD_PATTERNS.items():
+            contacts[field] = self.found.get(field) or first_match(pattern, build, self._tail)
+        return contacts
+
+def scan_page(url, stop=None):
+    if stop is not None and stop.is_set():
+        return None
+    scanner = ContactScanner(stop)
+    response = fetch(url, source='websites', max_bytes=get_config().enrichment.website_max_bytes,
+                     on_chunk=scanner.feed)
+    if response.status_code != 200:
+        return None
+    return scanner.finish(response.content)
+
+@retry()
+def scan_homepage(url):
+    return scan_page(url)
+
+def find_contacts(website):
+    # Website ka result domain par cache hota hai (Instagram results wale cache me hi)
+    domain = website_domain(website)
+    if not domain:
+        return empty_contacts()
+
+    cache = get_instagram_cache()
+    key = f'contacts:{domain}'
+    if cache and get_cache_mode() == 'use':
+        found, contacts = cache.get(key)
+        if found:
+            return contacts
+
+    contacts, complete = scan_site(website)
+    if cache and complete:
+        settings = get_config().instagram_cache
+        cache.set(key, contacts, settings.hit_ttl if any(contacts.values()) else settings.miss_ttl)
+    return contacts
+
+def scan_site(website):
+    # Homepage ek baar fetch hoti hai; jo fields na milein unke liye contact pages
+    # parallel probe hote hain, aur sab fields milte hi baaki probes cancel
+    base = website if website.startswith('http') else 'https://' + website
+    try:
+        contacts = scan_homepage(base)
+    except Exception as e:
+        logger.error(f"Error scanning website {website}: {str(e)}")
+        return empty_contacts(), False
+    if contacts is None:
+        return empty_contacts(), False
+
+    paths = get_config().enrichment.contact_pages
+    if all(contacts.values()) or not paths:
+        return contacts, True
+
+    stop = threading.Event()
+    executor = ThreadPoolExecutor(max_workers=len(paths))
+    futures = [executor.submit(scan_page, urljoin(base, path), stop) for path in paths]
+    try:
+        for future in as_completed(futures):
+            try:
+                page_contacts = future.result()
+            except Exception:
+                continue
+            for field, value in (page_contacts or {}).items():
+                if value and not contacts[field]:
+                    contacts[field] = value
+            if all(contacts.values()):
+                break
+    finally:
+        stop.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return contacts, True
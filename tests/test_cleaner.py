@@ -0,0 +1,30 @@
+from cleaner import clean_and_merge
+from lead_index import LeadIndex
+
+def test_clean_and_merge(tmp_path):
+    google_maps_leads = [
+        {'name': 'Smile Dental Clinic ', 'phone': '098200 12345', 'source': 'Google Maps'},
+        {'name': 'Pearl Dental Care', 'phone': None, 'source': 'Google Maps'},
+        None,
+    ]
+    justdial_leads = [
+        # Same phone alag format me, aur naam ka typo: dono duplicate
+        {'name': 'Smile Dental Clinik', 'phone': '+91 98200 12345', 'source': 'JustDial'},
+        {'name': 'PEARL DENTAL CARE', 'phone': '98200 99999', 'source': 'JustDial'},
+        {'name': 'City Dental Hospital', 'phone': '98200 54321', 'source': 'JustDial'},
+        {'name': '', 'phone': '98200 11111', 'source': 'JustDial'},
+    ]
+    index = LeadIndex(str(tmp_path / 'index.sqlite3'))
+    try:
+        index.mark([{'name': 'City Dental Hospital', 'phone': '+919820054321'}])
+        leads = clean_and_merge(google_maps_leads, justdial_leads, index=index)
+    finally:
+        index.close()
+
+    # Pehle Google Maps wale rakhe jaate hain
+    assert [(lead['name'], lead['source'], lead['is_new']) for lead in leads] == [
+        ('Smile Dental Clinic', 'Google Maps', True),
+        ('Pearl Dental Care', 'Google Maps', True),
+        ('City Dental Hospital', 'JustDial', False),
+    ]
+    assert leads[0]['phone'] == '+919820012345'
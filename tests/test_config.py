@@ -0,0 +1,41 @@
+import os
+import pytest
+from utils import config
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+    path = tmp_path / 'config.yml'
+    monkeypatch.setattr(config, 'CONFIG_PATH', str(path))
+    monkeypatch.setattr(config, 'RELOAD_CHECK_INTERVAL', 0)
+    monkeypatch.setattr(config, '_config', None)
+    monkeypatch.setattr(config, '_mtime', None)
+
+    def write(text, mtime):
+        path.write_text(text)
+        os.utime(path, (mtime, mtime))
+    return write
+
+def test_reload_on_mtime_change(config_file):
+    config_file('jobs:\n  workers: 3\n', 1000)
+    assert config.get_config().jobs.workers == 3
+
+    config_file('jobs:\n  workers: 5\n', 2000)
+    assert config.get_config().jobs.workers == 5
+
+def test_broken_reload_keeps_previous_config(config_file):
+    config_file('jobs:\n  workers: 3\nsources:\n  justdial:\n    rate_limit: 1\n', 1000)
+    assert config.get_config().jobs.workers == 3
+
+    # Adhoora save: YAML toota hua, phir khali file
+    config_file('jobs:\n  workers: [3\n', 2000)
+    assert config.get_config().jobs.workers == 3
+    config_file('', 3000)
+    assert config.get_config().jobs.workers == 3
+    assert config.get_config().source('justdial').rate_limit == 1
+
+    # Save poora hote hi naya config
+    config_file('jobs:\n  workers: 4\n', 4000)
+    assert config.get_config().jobs.workers == 4
+
+def test_missing_file_uses_defaults(config_file):
+    assert config.get_config().jobs.workers == config.JobsSettings().workers
@@ -0,0 +1,37 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from utils import http_cache
+from utils.http_client import fetch, get_session
+
+class CookieEchoHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = (self.headers.get('Cookie') or '-').encode('utf-8')
+        self.send_response(200)
+        self.send_header('Set-Cookie', 'tracker=1; Path=/')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+@pytest.fixture
+def echo_url(monkeypatch):
+    server = ThreadingHTTPServer(('127.0.0.1', 0), CookieEchoHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(http_cache, '_mode', 'off')
+    yield f'http://127.0.0.1:{server.server_port}/'
+    server.shutdown()
+    server.server_close()
+
+def test_shared_session_does_not_replay_cookies(echo_url):
+    # Pehle response ka Set-Cookie agli request (kisi aur job / thread ki) me nahi jaata
+    assert fetch(echo_url).text == '-'
+    assert fetch(echo_url).text == '-'
+    assert len(get_session().cookies) == 0
+
+def test_explicit_cookies_are_sent(echo_url):
+    assert fetch(echo_url, cookies={'CONSENT': 'YES+cb'}).text == 'CONSENT=YES+cb'
+    assert fetch(echo_url).text == '-'
@@ -0,0 +1,45 @@
+import threading
+import time
+import pytest
+from jobs import JobManager, JobQueueFull
+
+def wait_for(manager, job_id, status, timeout=5):
+    deadline = time.monotonic() + timeout
+    while manager.get(job_id)['status'] != status:
+        assert time.monotonic() < deadline, f"job stayed {manager.get(job_id)['status']}"
+        time.sleep(0.01)
+
+@pytest.fixture
+def manager():
+    release = threading.Event()
+
+    def run(params, cancel):
+        release.wait(5)
+        return params
+
+    manager = JobManager(run, workers=1, max_queue=2)
+    manager.release = release
+    yield manager
+    release.set()
+    manager.close()
+
+def test_cancelled_jobs_free_their_queue_slot(manager):
+    running = manager.submit({'n': 0})['job_id']
+    wait_for(manager, running, 'running')
+    queued = [manager.submit({'n': n})['job_id'] for n in (1, 2)]
+    with pytest.raises(JobQueueFull):
+        manager.submit({'n': 3})
+
+    # Cancel hua job worker ke skip karne tak queue me hai, par capacity nahi gherta
+    for job_id in queued:
+        assert manager.cancel(job_id)['status'] == 'cancelled'
+    later = [manager.submit({'n': n})['job_id'] for n in (4, 5)]
+    with pytest.raises(JobQueueFull):
+        manager.submit({'n': 6})
+
+    manager.release.set()
+    for job_id in later:
+        wait_for(manager, job_id, 'done')
+    assert [manager.get(job_id)['result'] for job_id in later] == [{'n': 4}, {'n': 5}]
+    assert manager.health()['jobs'] == {'queued': 0, 'running': 0, 'done': 3, 'failed': 0, 'cancelled': 2}
+    assert manager.stats['rejected'] == 2
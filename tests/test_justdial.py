@@ -0,0 +1,89 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+import pytest
+from scrapers import justdial
+from scrapers.google_maps import ScrapeError
+from utils import http_cache
+
+PER_PAGE = 3
+LAST_PAGE = 3
+
+def listing_html(page):
+    # LAST_PAGE ke baad khali results page (JustDial bhi aisa hi karta hai)
+    cards = ''.join(
+        f'<li class="cntanr resultbox"><h2 class="business-name">Clinic {page}-{idx}</h2>'
+        f'<span class="contact-info">98200 {page:02d}{idx:03d}</span></li>'
+        for idx in range(PER_PAGE)
+    ) if page <= LAST_PAGE else ''
+    return f'<html><head><title>Results</title></head><body><ul class="results">{cards}</ul></body></html>'
+
+class StandInHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        page = int(query.get('page', ['1'])[0])
+        self.server.pages.append(page)
+        if page in self.server.failing:
+            self.send_error(503)
+            return
+        body = listing_html(page).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+@pytest.fixture
+def stand_in(monkeypatch):
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StandInHandler)
+    server.pages = []
+    server.failing = set()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(justdial, 'JUSTDIAL_SEARCH_URL', f'http://127.0.0.1:{server.server_port}/search')
+    # Test pages disk cache me nahi jaane chahiye
+    monkeypatch.setattr(http_cache, '_mode', 'off')
+    started = set(threading.enumerate())
+    yield server
+    # Limit ke aage nikle page fetches background me poore hone do, phir server band
+    for worker in set(threading.enumerate()) - started:
+        worker.join(timeout=10)
+    server.shutdown()
+    server.server_close()
+
+def test_iter_justdial_pages_until_limit(stand_in):
+    leads = list(justdial.iter_justdial('dentist', 'mumbai', limit=7))
+
+    assert [lead['name'] for lead in leads] == [f'Clinic {page}-{idx}' for page in (1, 2, 3) for idx in range(3)][:7]
+    assert all(lead['source'] == 'JustDial' for lead in leads)
+    # Pehle page ke baad baaki pages parallel mangwaye jaate hain, limit ke aage nahi
+    assert sorted(stand_in.pages) == [1, 2, 3]
+
+def test_iter_justdial_stops_at_last_page(stand_in):
+    leads = list(justdial.iter_justdial('dentist', 'mumbai', limit=50))
+
+    assert len(leads) == PER_PAGE * LAST_PAGE
+    assert len({lead['name'] for lead in leads}) == len(leads)
+
+def test_iter_justdial_stop_event(stand_in):
+    stop = threading.Event()
+    leads = []
+    for lead in justdial.iter_justdial('dentist', 'mumbai', limit=50, stop=stop):
+        leads.append(lead)
+        stop.set()
+
+    # Chal rahe page ke leads ke baad naya page nahi liya jaata
+    assert len(leads) <= PER_PAGE
+
+def test_iter_justdial_page_failure_is_an_error(stand_in):
+    stand_in.failing.add(2)
+    leads = []
+    # Fail hua page "results khatam" nahi maana jaata, warna adhoora result cache ho jaata
+    with pytest.raises(ScrapeError):
+        for lead in justdial.iter_justdial('dentist', 'mumbai', limit=50):
+            leads.append(lead)
+
+    assert len(leads) == PER_PAGE
@@ -0,0 +1,36 @@
+import os
+from scrapers.justdial_parser import find_listings, extract_justdial_lead
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURES, name), encoding='utf-8') as f:
+        return f.read()
+
+def test_find_listings_skips_script_templates_and_comments():
+    listings = find_listings(read_fixture('justdial_search.html'))
+
+    # Script ka '<div class="card-body">' aur comment wala <li> card nahi hain
+    assert len(listings) == 3
+    assert all(listing.name == 'li' for listing in listings)
+
+def test_extract_justdial_lead():
+    leads = [extract_justdial_lead(listing) for listing in find_listings(read_fixture('justdial_search.html'))]
+
+    assert leads[0] == {
+        'name': 'Smile Dental Clinic',
+        'phone': '+91 98200 12345',
+        'website': 'https://smiledental.in/',
+        'address': 'Shop 4, Andheri West, Mumbai',
+        'maps_url': None,
+        'source': 'JustDial',
+    }
+    # Phone text na ho to tel: link se
+    assert leads[1]['name'] == 'Pearl Dental Care'
+    assert leads[1]['phone'] == '02226401234'
+    assert leads[1]['website'] is None
+    # Bina naam wala card lead nahi banta
+    assert leads[2] is None
+
+def test_find_listings_without_cards():
+    assert find_listings('<html><head><script>var t = "<div class=\'card\'>";</script></head><body></body></html>') == []
@@ -0,0 +1,32 @@
+from cleaner import clean_stream
+from lead_index import LeadIndex
+
+LEADS = [
+    {'name': 'Smile Dental Clinic', 'phone': '098200 12345', 'source': 'Google Maps'},
+    {'name': 'Pearl Dental Care', 'phone': '98200 12346', 'source': 'JustDial'},
+]
+
+def run(path, remember=()):
+    index = LeadIndex(str(path))
+    try:
+        leads = list(clean_stream([[dict(lead) for lead in LEADS]], index=index))
+        index.remember([lead for lead in leads if lead['name'] in remember])
+        return [lead['is_new'] for lead in leads]
+    finally:
+        index.close()
+
+def test_unexported_leads_stay_new(tmp_path):
+    path = tmp_path / 'index.sqlite3'
+
+    # Pehla run export se pehle crash: kuch remember nahi hua, agla run bhi inhe naya maane
+    assert run(path) == [True, True]
+    assert run(path, remember={'Smile Dental Clinic'}) == [True, True]
+    assert run(path) == [False, True]
+
+def test_mark_adds_by_default(tmp_path):
+    index = LeadIndex(str(tmp_path / 'index.sqlite3'))
+    try:
+        assert [lead['is_new'] for lead in index.mark([dict(lead) for lead in LEADS])] == [True, True]
+        assert [lead['is_new'] for lead in index.mark([dict(lead) for lead in LEADS])] == [False, False]
+    finally:
+        index.close()
@@ -0,0 +1,72 @@
+import asyncio
+import os
+import pytest
+from playwright.async_api import async_playwright
+from scrapers.google_maps import _scrape_google_maps
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+# Feed page sirf utna jitna scraper padhta hai: search XHR chalne ke baad results feed
+# (place links ke feature ids payload fixture wale) aur end-of-list text
+PLACE_URLS = [
+    'https://www.google.com/maps/place/Smile+Dental+Clinic/data=!4m7!3m6!1s0x3be7c9b:0x1a2b3c!8m2!3d19.1363!4d72.8277',
+    'https://www.google.com/maps/place/Pearl+Dental+Care/data=!4m7!3m6!1s0x3be7c91:0x4d5e6f!8m2!3d19.0596!4d72.8295',
+]
+FEED_PAGE = """<!DOCTYPE html><html><body><script>
+fetch('/search?tbm=map&q=dentist+mumbai').then(() => {
+    document.body.insertAdjacentHTML('beforeend', '<div role="feed">' + %s.map(
+        url => '<div><a href="' + url + '">place</a></div>').join('') +
+        "<p>You've reached the end of the list</p></div>");
+});
+</script></body></html>"""
+# Payload me Pearl Dental Care ka phone nahi hai, wo detail page se bharta hai
+PEARL_PAGE = """<!DOCTYPE html><html><body><h1>Pearl Dental Care</h1>
+<button data-item-id="phone:tel:02226401234">022 2640 1234</button>
+<button data-item-id="address" aria-label="Address: Hill Road, Bandra, Mumbai">Hill Road</button>
+</body></html>"""
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURES, name), encoding='utf-8') as f:
+        return f.read()
+
+async def replay(route):
+    url = route.request.url
+    if '/maps/search/' in url:
+        await route.fulfill(content_type='text/html', body=FEED_PAGE % repr(PLACE_URLS).replace("'", '"'))
+    elif 'tbm=map' in url:
+        await route.fulfill(content_type='application/json; charset=UTF-8', body=read_fixture('maps_search_payload.txt'))
+    elif '/maps/place/Pearl' in url:
+        await route.fulfill(content_type='text/html', body=PEARL_PAGE)
+    else:
+        await route.abort()
+
+async def scrape_replayed(opened):
+    async with async_playwright() as p:
+        try:
+            browser = await p.chromium.launch(headless=True)
+        except Exception as e:
+            pytest.skip(f"Chromium not available: {str(e).splitlines()[0]}")
+        try:
+            context = await browser.new_context()
+            await context.route('**/*', replay)
+            context.on('request', lambda request: opened.append(request.url) if '/maps/place/' in request.url else None)
+            emitted = []
+            leads = await _scrape_google_maps(context, 'dentist', 'mumbai', 10, 2, 'feed', 'playwright',
+                                              on_lead=lambda lead: emitted.append(dict(lead)))
+            return leads, emitted
+        finally:
+            await browser.close()
+
+def test_feed_mode_builds_leads_from_replayed_payload():
+    opened = []
+    leads, emitted = asyncio.run(scrape_replayed(opened))
+
+    assert [lead['name'] for lead in leads] == ['Smile Dental Clinic', 'Pearl Dental Care']
+    # Poora payload wala lead bina place page ke; adhoora wala detail page se bhara
+    assert leads[0]['phone'] == '098200 12345'
+    assert leads[0]['maps_url'] == PLACE_URLS[0]
+    assert leads[1]['phone'] == '02226401234'
+    assert leads[1]['category'] == 'Dental clinic'
+    assert all('feature_id' not in lead for lead in leads)
+    assert [url.split('?')[0] for url in opened] == [PLACE_URLS[1]]
+    assert sorted(lead['name'] for lead in emitted) == ['Pearl Dental Care', 'Smile Dental Clinic']
@@ -0,0 +1,104 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from scrapers.instagram_finder import InstagramScanner, SCAN_OVERLAP, find_instagram, lookup_website_instagram
+from scrapers.website_contacts import ContactScanner
+from utils import http_cache
+
+CHUNK_SIZES = [1, 2, 3, 7, 13, 64, SCAN_OVERLAP - 1, SCAN_OVERLAP, SCAN_OVERLAP + 1, 1000, 100000]
+PADDING = b'<div class="row"><p>Painless root canal, braces and implants.</p></div>\n' * 40
+CONTACTS_HTML = (
+    b'<footer><a href="mailto:info@clinic.co.in">info@clinic.co.in</a>'
+    b'<a href="https://www.instagram.com/smiledental_mumbai/">Instagram</a>'
+    b'<a href="https://www.facebook.com/smiledentalmumbai">Facebook</a>'
+    b'<a href="https://www.linkedin.com/company/smile-dental/">LinkedIn</a>'
+    b'<a href="https://wa.me/919820012345">WhatsApp</a></footer>'
+)
+
+class WebsiteHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = PADDING + CONTACTS_HTML + PADDING
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+@pytest.fixture
+def website_url(monkeypatch):
+    server = ThreadingHTTPServer(('127.0.0.1', 0), WebsiteHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(http_cache, '_mode', 'off')
+    yield f'http://127.0.0.1:{server.server_port}/'
+    server.shutdown()
+    server.server_close()
+
+def scan(scanner, body, size):
+    # fetch() ki tarah chunks feed karo, feed() True de to download rok do
+    fed = 0
+    for start in range(0, len(body), size):
+        chunk = body[start:start + size]
+        fed += len(chunk)
+        if scanner.feed(chunk):
+            break
+    return scanner.finish(body), fed
+
+def split_bodies(body, marker):
+    # Har chunk size ke alawa, ek split theek marker par
+    yield from ((body, size) for size in CHUNK_SIZES)
+    yield body, body.index(marker)
+
+def test_email_split_at_tld_boundary():
+    # Ek split theek 'info@clinic.co' + '.in' par
+    body = PADDING + b'<p>Mail us: info@clinic.co.in today</p>' + PADDING
+    for body, size in split_bodies(body, b'.in today'):
+        contacts, _ = scan(ContactScanner(), body, size)
+        assert contacts['email'] == 'info@clinic.co.in', size
+
+def test_instagram_handle_split_mid_token():
+    for html in (b'<a href="https://www.instagram.com/smiledental_mumbai/">Follow</a>',
+                 b'<p>Follow instagram.com/smiledental_mumbai for offers</p>'):
+        body = PADDING + html + PADDING
+        for body, size in split_bodies(body, b'ental_mumbai'):
+            assert scan(InstagramScanner(), body, size)[0] == 'https://www.instagram.com/smiledental_mumbai/', size
+            contacts, _ = scan(ContactScanner(), body, size)
+            assert contacts['instagram'] == 'https://www.instagram.com/smiledental_mumbai/', size
+
+def test_body_shorter_than_overlap():
+    body = b'<p>info@clinic.co.in, instagram.com/smiledental, wa.me/919820012345</p>'
+    assert len(body) < SCAN_OVERLAP
+    for size in CHUNK_SIZES:
+        contacts, fed = scan(ContactScanner(), body, size)
+        assert fed == len(body)
+        assert contacts['email'] == 'info@clinic.co.in', size
+        assert contacts['instagram'] == 'https://www.instagram.com/smiledental/', size
+        assert contacts['whatsapp'] == 'https://wa.me/919820012345', size
+        assert contacts['facebook'] is None
+
+def test_stops_once_all_fields_found():
+    body = PADDING + CONTACTS_HTML + PADDING * 10
+    expected = {
+        'instagram': 'https://www.instagram.com/smiledental_mumbai/',
+        'email': 'info@clinic.co.in',
+        'facebook': 'https://www.facebook.com/smiledentalmumbai/',
+        'linkedin': 'https://www.linkedin.com/company/smile-dental/',
+        'whatsapp': 'https://wa.me/919820012345',
+    }
+    for size in CHUNK_SIZES[:-1]:
+        contacts, fed = scan(ContactScanner(), body, size)
+        assert contacts == expected, size
+        # Contacts ke baad overlap jitna aur padh ke ruk jaata hai, poori body nahi
+        assert fed <= len(PADDING) + len(CONTACTS_HTML) + 2 * SCAN_OVERLAP + size, size
+
+    instagram, fed = scan(InstagramScanner(), body, 64)
+    assert instagram == expected['instagram']
+    assert fed < len(PADDING) + len(CONTACTS_HTML)
+
+def test_find_instagram_from_website(website_url):
+    assert lookup_website_instagram(website_url) == ('https://www.instagram.com/smiledental_mumbai/', True)
+    # Website par mil jaye to Google search nahi hota
+    assert find_instagram('Smile Dental Clinic', website_url) == 'https://www.instagram.com/smiledental_mumbai/'
@@ -0,0 +1,182 @@
+import asyncio
+import atexit
+import os
+import threading
+from contextlib import asynccontextmanager
+from playwright.async_api import async_playwright
+from utils.logger import logger
+from utils.config import get_config
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+def get_pool_settings():
+    config = get_config()
+    return {
+        'headless': config.browser.headless,
+        'max_contexts': config.browser_pool.max_contexts,
+        'max_pages_per_browser': config.browser_pool.max_pages_per_browser,
+        'max_memory_mb': config.browser_pool.max_memory_mb,
+    }
+
+# Ek hi Chromium background thread ke event loop mein chalta hai. Kisi bhi
+# thread se run() ke through coroutine bhejo, andar context() fresh context deta hai.
+class BrowserPool:
+    def __init__(self, headless=True, max_contexts=4, max_pages_per_browser=500, max_memory_mb=1500):
+        self.headless = headless
+        self.max_contexts = max_contexts
+        self.max_pages_per_browser = max_pages_per_browser
+        self.max_memory_mb = max_memory_mb
+
+        self._loop = None
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self._playwright = None
+        self._semaphore = None
+        self._browser_lock = None
+
+        self._browser = None
+        self._pages_served = 0
+        self._active = {}
+        self._retiring = set()
+        self.launches = 0
+        self.recycles = 0
+
+    def start(self):
+        with self._start_lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(target=self._loop.run_forever, name='browser-pool', daemon=True)
+            self._thread.start()
+            asyncio.run_coroutine_threadsafe(self._setup(), self._loop).result()
+            logger.info("Browser pool started")
+            if self.max_memory_mb and psutil is None:
+                logger.warning(f"psutil is not installed: browser_pool.max_memory_mb ({self.max_memory_mb} MB) "
+                               "is ignored, browsers are recycled only by page count")
+
+    async def _setup(self):
+        self._playwright = await async_playwright().start()
+        self._semaphore = asyncio.Semaphore(self.max_contexts)
+        self._browser_lock = asyncio.Lock()
+
+    def run(self, coro_fn, *args, timeout=None, **kwargs):
+        self.start()
+        future = asyncio.run_coroutine_threadsafe(coro_fn(*args, **kwargs), self._loop)
+        return future.result(timeout)
+
+    @asynccontextmanager
+    async def context(self, **kwargs):
+        async with self._semaphore:
+            browser = await self._acquire_browser()
+            context = await browser.new_context(**kwargs)
+            context.on('page', lambda page: self._count_page(browser))
+            self._active[browser] = self._active.get(browser, 0) + 1
+            try:
+                yield context
+            finally:
+                try:
+                    await context.close()
+                except Exception as e:
+                    logger.debug(f"Error closing browser context: {str(e)}")
+                self._active[browser] -= 1
+                await self._release_browser(browser)
+
+    def _count_page(self, browser):
+        if browser is self._browser:
+            self._pages_served += 1
+
+    async def _acquire_browser(self):
+        async with self._browser_lock:
+            if self._browser and not self._browser.is_connected():
+                logger.warning("Pooled browser disconnected, relaunching")
+                await self._retire_browser()
+            elif self._browser and self._needs_recycle():
+                self.recycles += 1
+                logger.info(f"Recycling browser after {self._pages_served} pages")
+                await self._retire_browser()
+
+            if self._browser is None:
+                self._browser = await self._playwright.chromium.launch(headless=self.headless)
+                self._pages_served = 0
+                self.launches += 1
+
+            return self._browser
+
+    async def _retire_browser(self):
+        retired = self._browser
+        self._browser = None
+        self._retiring.add(retired)
+        await self._release_browser(retired)
+
+    async def _release_browser(self, browser):
+        # Purana browser tabhi band karo jab uske saare contexts khatam ho jaayein
+        if browser in self._retiring and self._active.get(browser, 0) <= 0:
+            self._retiring.discard(browser)
+            self._active.pop(browser, None)
+            try:
+                await browser.close()
+            except Exception as e:
+                logger.debug(f"Error closing retired browser: {str(e)}")
+
+    def _needs_recycle(self):
+        if self.max_pages_per_browser and self._pages_served >= self.max_pages_per_browser:
+            return True
+        if self.max_memory_mb and psutil is not None:
+            return self._browser_memory_mb() >= self.max_memory_mb
+        return False
+
+    def _browser_memory_mb(self):
+        try:
+            children = psutil.Process(os.getpid()).children(recursive=True)
+            rss = sum(child.memory_info().rss for child in children if 'chrom' in child.name().lower())
+            return rss / (1024 * 1024)
+        except Exception:
+            return 0
+
+    def health(self):
+        status = {
+            'running': bool(self._thread and self._thread.is_alive()),
+            'connected': bool(self._browser and self._browser.is_connected()),
+            'active_contexts': sum(self._active.values()),
+            'max_contexts': self.max_contexts,
+            'pages_served': self._pages_served,
+            'launches': self.launches,
+            'recycles': self.recycles,
+        }
+        if psutil is not None and status['running']:
+            status['memory_mb'] = round(self._browser_memory_mb(), 1)
+        return status
+
+    def close(self):
+        if not (self._thread and self._thread.is_alive()):
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result(timeout=30)
+        except Exception as e:
+            logger.debug(f"Error shutting down browser pool: {str(e)}")
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+
+    async def _shutdown(self):
+        for browser in list(self._retiring) + ([self._browser] if self._browser else []):
+            try:
+                await browser.close()
+            except Exception:
+                pass
+        self._browser = None
+        self._retiring.clear()
+        await self._playwright.stop()
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def get_browser_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = BrowserPool(**get_pool_settings())
+            atexit.register(_pool.close)
+        return _pool
@@ -0,0 +1,209 @@
+import os
+import threading
+import time
+from dataclasses import dataclass, field, fields
+import yaml
+from utils.logger import logger
+
+CONFIG_PATH = 'config.yml'
+
+# File ka mtime itne seconds me ek hi baar check hota hai
+RELOAD_CHECK_INTERVAL = 1.0
+
+DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+@dataclass(frozen=True)
+class BrowserSettings:
+    headless: bool = True
+    timeout: float = 20
+    max_scroll: int = 10
+
+@dataclass(frozen=True)
+class ScrapingSettings:
+    delay_min: float = 0.5
+    delay_max: float = 2.0
+    max_retries: int = 3
+
+@dataclass(frozen=True)
+class SourceSettings:
+    concurrency: int = 4
+    rate_limit: float = 0 # requests per second, 0 = no limit
+    timeout: float = 15
+
+@dataclass(frozen=True)
+class HttpSettings:
+    pool_size: int = 32
+    max_per_host: int = 4
+    max_response_bytes: int = 5_000_000
+
+@dataclass(frozen=True)
+class GoogleMapsSettings:
+    mode: str = 'detail'
+    feed_required_fields: tuple = ('phone', 'address')
+    backend: str = 'playwright'
+    detail_concurrency: int = 4
+    scroll_timeout: float = 3
+    max_idle_scrolls: int = 3
+
+@dataclass(frozen=True)
+class JustdialSettings:
+    mode: str = 'http'
+    max_pages: int = 10
+    scroll_timeout: float = 3
+    max_idle_scrolls: int = 3
+
+@dataclass(frozen=True)
+class PipelineSettings:
+    google_maps_timeout: float = 900
+    justdial_timeout: float = 300
+    queue_size: int = 100
+
+@dataclass(frozen=True)
+class JobsSettings:
+    workers: int = 2
+    max_queue: int = 20
+    result_ttl: float = 3600
+
+@dataclass(frozen=True)
+class ScrapeCacheSettings:
+    enabled: bool = True
+    ttl: float = 600
+    max_entries: int = 100
+
+@dataclass(frozen=True)
+class BrowserPoolSettings:
+    max_contexts: int = 4
+    max_pages_per_browser: int = 500
+    max_memory_mb: int = 1500
+
+@dataclass(frozen=True)
+class LeadIndexSettings:
+    path: str = os.path.join('db', 'lead_index.sqlite3')
+    max_age_days: int = 180
+
+@dataclass(frozen=True)
+class HttpCacheSettings:
+    enabled: bool = True
+    path: str = os.path.join('db', 'http_cache.sqlite3')
+    max_size_mb: int = 500
+    default_ttl: float = 7 * 86400
+    ttls: dict = field(default_factory=dict) # domain -> seconds, 0 = cache nahi karna
+
+@dataclass(frozen=True)
+class InstagramCacheSettings:
+    enabled: bool = True
+    path: str = os.path.join('db', 'instagram_cache.sqlite3')
+    hit_ttl: float = 30 * 86400
+    miss_ttl: float = 3 * 86400
+
+@dataclass(frozen=True)
+class EnrichmentSettings:
+    concurrency: int = 16
+    website_max_bytes: int = 2_000_000
+    contact_pages: tuple = ('/contact', '/contact-us', '/about-us')
+
+@dataclass(frozen=True)
+class Config:
+    browser: BrowserSettings = field(default_factory=BrowserSettings)
+    scraping: ScrapingSettings = field(default_factory=ScrapingSettings)
+    http: HttpSettings = field(default_factory=HttpSettings)
+    http_cache: HttpCacheSettings = field(default_factory=HttpCacheSettings)
+    google_maps: GoogleMapsSettings = field(default_factory=GoogleMapsSettings)
+    justdial: JustdialSettings = field(default_factory=JustdialSettings)
+    pipeline: PipelineSettings = field(default_factory=PipelineSettings)
+    jobs: JobsSettings = field(default_factory=JobsSettings)
+    scrape_cache: ScrapeCacheSettings = field(default_factory=ScrapeCacheSettings)
+    browser_pool: BrowserPoolSettings = field(default_factory=BrowserPoolSettings)
+    lead_index: LeadIndexSettings = field(default_factory=LeadIndexSettings)
+    enrichment: EnrichmentSettings = field(default_factory=EnrichmentSettings)
+    instagram_cache: InstagramCacheSettings = field(default_factory=InstagramCacheSettings)
+    sources: dict = field(default_factory=dict)
+    user_agents: tuple = (DEFAULT_USER_AGENT,)
+    raw: dict = field(default_factory=dict)
+
+    def source(self, name):
+        return self.sources.get(name) or SourceSettings()
+
+def build_section(cls, data):
+    # Sirf jaane pehchaane keys, field ke type me convert karke
+    if not isinstance(data, dict):
+        return cls()
+    values = {}
+    for f in fields(cls):
+        if f.name not in data or data[f.name] is None:
+            continue
+        value = data[f.name]
+        try:
+            if f.type is tuple:
+                value = tuple(value) if isinstance(value, (list, tuple)) else (value,)
+            elif f.type in (bool, int, float, str):
+                value = f.type(value)
+        except (TypeError, ValueError):
+            continue
+        values[f.name] = value
+    return cls(**values)
+
+def parse_config(raw):
+    if not isinstance(raw, dict):
+        raw = {}
+
+    sources = raw.get('sources') or {}
+    user_agents = raw.get('user_agents') or [DEFAULT_USER_AGENT]
+
+    return Config(
+        browser=build_section(BrowserSettings, raw.get('browser')),
+        scraping=build_section(ScrapingSettings, raw.get('scraping')),
+        http=build_section(HttpSettings, raw.get('http')),
+        http_cache=build_section(HttpCacheSettings, raw.get('http_cache')),
+        google_maps=build_section(GoogleMapsSettings, raw.get('google_maps')),
+        justdial=build_section(JustdialSettings, raw.get('justdial')),
+        pipeline=build_section(PipelineSettings, raw.get('pipeline')),
+        jobs=build_section(JobsSettings, raw.get('jobs')),
+        scrape_cache=build_section(ScrapeCacheSettings, raw.get('scrape_cache')),
+        browser_pool=build_section(BrowserPoolSettings, raw.get('browser_pool')),
+        lead_index=build_section(LeadIndexSettings, raw.get('lead_index')),
+        enrichment=build_section(EnrichmentSettings, raw.get('enrichment')),
+        instagram_cache=build_section(InstagramCacheSettings, raw.get('instagram_cache')),
+        sources={name: build_section(SourceSettings, data) for name, data in sources.items()},
+        user_agents=tuple(user_agents),
+        raw=raw,
+    )
+
+_lock = threading.Lock()
+_config = None
+_mtime = None
+_checked_at = 0.0
+
+def get_config():
+    global _config, _mtime, _checked_at
+
+    now = time.monotonic()
+    if _config is not None and now - _checked_at < RELOAD_CHECK_INTERVAL:
+        return _config
+
+    with _lock:
+        _checked_at = now
+        try:
+            mtime = os.stat(CONFIG_PATH).st_mtime
+        except OSError:
+            mtime = None
+
+        if _config is None or mtime != _mtime:
+            _mtime = mtime
+            try:
+                with open(CONFIG_PATH, 'r') as f:
+                    raw = yaml.safe_load(f)
+                if not isinstance(raw, dict):
+                    raise ValueError("top level is not a mapping")
+                _config = parse_config(raw)
+            except Exception as e:
+                # Hot reload par adhoora save hua / toota file chal rahe server ko defaults par
+                # na daal de: purana config rehta hai, agla save (naya mtime) phir try hota hai
+                if _config is not None:
+                    logger.warning(f"Could not reload {CONFIG_PATH} ({str(e)}), keeping the previous config")
+                else:
+                    if mtime is not None:
+                        logger.warning(f"Could not load {CONFIG_PATH} ({str(e)}), using defaults")
+                    _config = parse_config({})
+
+        return _config
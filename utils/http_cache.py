@@ -0,0 +1,186 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from utils.config import get_config
+
+# use = cache se padho aur likho, refresh = hamesha network se laao (cache update hota hai), off = cache band
+CACHE_MODES = ('use', 'refresh', 'off')
+
+# Ye request headers response badal sakte hain, isliye key me shamil hain
+KEY_HEADERS = ('accept-language',)
+
+# Body decoded store hoti hai, isliye ye headers cached response par galat honge
+DROP_HEADERS = ('content-encoding', 'content-length', 'transfer-encoding')
+
+EVICT_BATCH = 100
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    expires_at REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses(last_access);
+"""
+
+def get_cache_settings():
+    return get_config().http_cache
+
+def cache_key(url, headers=None, cookies=None):
+    headers = {name.lower(): value for name, value in (headers or {}).items()}
+    parts = [url]
+    parts += [f'{name}: {headers[name]}' for name in KEY_HEADERS if name in headers]
+    parts += [f'cookie: {name}={value}' for name, value in sorted((cookies or {}).items())]
+    return hashlib.sha256('\n'.join(parts).encode('utf-8')).hexdigest()
+
+def ttl_for(host, settings=None):
+    # 'google.com' ka TTL www.google.com par bhi lagta hai; 0 = ye domain cache nahi hota
+    settings = settings or get_cache_settings()
+    host = host or ''
+    while host:
+        if host in settings.ttls:
+            return float(settings.ttls[host])
+        host = host.partition('.')[2]
+    return settings.default_ttl
+
+def build_response(entry):
+    response = Response()
+    response.status_code = entry['status']
+    response.reason = 'OK'
+    response.url = entry['url']
+    response.headers = CaseInsensitiveDict(entry['headers'])
+    response.encoding = get_encoding_from_headers(response.headers)
+    response._content = entry['body']
+    response._content_consumed = True
+    response.truncated = False
+    response.stopped_early = False
+    response.from_cache = True
+    return response
+
+# URL (+ key headers/cookies) ke hisaab se responses ka on-disk cache. Stale entries
+# ETag/Last-Modified se revalidate hoti hain, size max_size_mb se upar jaye to
+# sabse purane access wali entries hat jaati hain (LRU).
+class ResponseCache:
+    def __init__(self, path=None, max_bytes=None):
+        settings = get_cache_settings()
+        self.path = path or settings.path
+        self.max_bytes = max_bytes if max_bytes is not None else settings.max_size_mb * 1024 * 1024
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.executescript(SCHEMA)
+        self._size = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+        self.stats = {'hits': 0, 'misses': 0, 'revalidated': 0, 'stored': 0, 'evicted': 0}
+
+    def get(self, key):
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                'SELECT url, status, headers, body, etag, last_modified, expires_at FROM responses WHERE key = ?',
+                (key,)
+            ).fetchone()
+            if row is None:
+                self.stats['misses'] += 1
+                return None
+            now = time.time()
+            self._conn.execute('UPDATE responses SET last_access = ? WHERE key = ?', (now, key))
+            url, status, headers, body, etag, last_modified, expires_at = row
+            fresh = expires_at > now
+            if fresh:
+                self.stats['hits'] += 1
+
+        return {
+            'url': url,
+            'status': status,
+            'headers': json.loads(headers),
+            'body': body,
+            'etag': etag,
+            'last_modified': last_modified,
+            'fresh': fresh,
+        }
+
+    def store(self, key, response, ttl):
+        body = response.content or b''
+        headers = {name: value for name, value in response.headers.items() if name.lower() not in DROP_HEADERS}
+        now = time.time()
+
+        with self._lock, self._conn:
+            old = self._conn.execute('SELECT size FROM responses WHERE key = ?', (key,)).fetchone()
+            self._conn.execute(
+                'INSERT OR REPLACE INTO responses '
+                '(key, url, status, headers, body, size, etag, last_modified, expires_at, last_access) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (key, response.url, response.status_code, json.dumps(headers), body, len(body),
+                 response.headers.get('ETag'), response.headers.get('Last-Modified'), now + ttl, now)
+            )
+            self._size += len(body) - (old[0] if old else 0)
+            self.stats['stored'] += 1
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def revalidated(self, key, ttl):
+        # 304 mila: purani body hi sahi hai, sirf expiry aage badhao
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                'UPDATE responses SET expires_at = ?, last_access = ? WHERE key = ?', (now + ttl, now, key)
+            )
+            self.stats['revalidated'] += 1
+
+    def _evict(self):
+        while self._size > self.max_bytes:
+            rows = self._conn.execute(
+                'SELECT key, size FROM responses ORDER BY last_access LIMIT ?', (EVICT_BATCH,)
+            ).fetchall()
+            if not rows:
+                self._size = 0
+                return
+            for key, size in rows:
+                if self._size <= self.max_bytes:
+                    break
+                self._conn.execute('DELETE FROM responses WHERE key = ?', (key,))
+                self._size -= size
+                self.stats['evicted'] += 1
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+_cache = None
+_cache_lock = threading.Lock()
+_mode = 'use'
+
+def set_cache_mode(mode):
+    global _mode
+    if mode not in CACHE_MODES:
+        raise ValueError(f"cache mode must be one of: {', '.join(CACHE_MODES)}")
+    _mode = mode
+
+def get_cache_mode():
+    return _mode
+
+def get_response_cache():
+    global _cache
+    if _mode == 'off' or not get_cache_settings().enabled:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResponseCache()
+        return _cache
@@ -0,0 +1,188 @@
+import threading
+from http.cookiejar import DefaultCookiePolicy
+import time
+from urllib.parse import urlparse
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from utils.config import get_config
+from utils.http_cache import get_response_cache, get_cache_mode, cache_key, ttl_for, build_response
+from utils.proxies import get_random_user_agent
+
+# Sirf wahi encodings maango jo decode ho sakti hain (br tabhi jab brotli installed ho)
+ACCEPT_ENCODING = make_headers(accept_encoding=True)['accept-encoding']
+
+# Known hosts ka source (config.yml 'sources' me concurrency/rate_limit/timeout)
+HOST_SOURCES = {
+    'www.google.com': 'google_search',
+    'google.com': 'google_search',
+    'www.justdial.com': 'justdial',
+    'justdial.com': 'justdial',
+}
+DEFAULT_SOURCE = 'websites'
+
+class RateLimiter:
+    def __init__(self, rate):
+        self.rate = rate
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        if self.rate <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + 1.0 / self.rate
+        if start > now:
+            time.sleep(start - now)
+
+_session = None
+_session_lock = threading.Lock()
+_host_controls = {}
+_host_controls_lock = threading.Lock()
+_stats_lock = threading.Lock()
+_truncated = 0
+
+def get_session():
+    global _session
+    with _session_lock:
+        if _session is None:
+            config = get_config()
+            pool_maxsize = max([config.http.max_per_host] + [source.concurrency for source in config.sources.values()])
+            session = requests.Session()
+            # Session sab threads / jobs / hosts me shared hai: Set-Cookie jar me save nahi hote
+            # (warna ek site ke cookies doosri requests me jaate aur cache key se bahar rehte).
+            # Cookies sirf fetch(cookies=...) se, har request ke apne
+            session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+            for prefix in ('http://', 'https://'):
+                session.mount(prefix, HTTPAdapter(pool_connections=config.http.pool_size, pool_maxsize=pool_maxsize))
+            _session = session
+        return _session
+
+def source_for(url):
+    return HOST_SOURCES.get(urlparse(url).hostname or '', DEFAULT_SOURCE)
+
+def get_host_controls(host, source):
+    # Har (host, source) ka apna concurrency slot aur rate limiter. Business websites
+    # (default source) par per-host cap http.max_per_host hai, baaki par source ki concurrency.
+    key = (host, source)
+    with _host_controls_lock:
+        if key not in _host_controls:
+            config = get_config()
+            source_settings = config.source(source)
+            cap = config.http.max_per_host if source == DEFAULT_SOURCE else source_settings.concurrency
+            _host_controls[key] = (threading.BoundedSemaphore(max(1, cap)), RateLimiter(source_settings.rate_limit))
+        return _host_controls[key]
+
+def fetch(url, source=None, headers=None, params=None, cookies=None, timeout=None,
+          allow_redirects=True, max_bytes=None, on_chunk=None):
+    # on_chunk(chunk) True return kare to baaki body download nahi hoti (response.stopped_early)
+    global _truncated
+
+    config = get_config()
+    source = source or source_for(url)
+    host = urlparse(url).hostname or ''
+    slot, limiter = get_host_controls(host, source)
+
+    request_headers = {
+        'User-Agent': get_random_user_agent(),
+        'Accept-Encoding': ACCEPT_ENCODING,
+    }
+    if headers:
+        request_headers.update(headers)
+
+    # Fresh cached response ho to network (aur rate limiter) tak jaana hi nahi padta
+    cache = get_response_cache()
+    ttl = ttl_for(host) if cache else 0
+    key = entry = None
+    if cache and ttl > 0:
+        key = cache_key(requests.Request('GET', url, params=params).prepare().url, request_headers, cookies)
+        entry = cache.get(key) if get_cache_mode() == 'use' else None
+        if entry and entry['fresh']:
+            return feed_cached(build_response(entry), on_chunk)
+        if entry and entry['etag']:
+            request_headers['If-None-Match'] = entry['etag']
+        if entry and entry['last_modified']:
+            request_headers['If-Modified-Since'] = entry['last_modified']
+
+    with slot:
+        limiter.wait()
+        response = get_session().get(
+            url,
+            headers=request_headers,
+            params=params,
+            cookies=cookies,
+            timeout=timeout or config.source(source).timeout,
+            allow_redirects=allow_redirects,
+            stream=True
+        )
+        try:
+            read_body(response, max_bytes or config.http.max_response_bytes, on_chunk)
+        finally:
+            response.close()
+
+    if response.truncated:
+        with _stats_lock:
+            _truncated += 1
+
+    if key:
+        if response.status_code == 304 and entry:
+            cache.revalidated(key, ttl)
+            return feed_cached(build_response(entry), on_chunk)
+        no_store = 'no-store' in response.headers.get('Cache-Control', '').lower()
+        complete = not response.truncated and not response.stopped_early
+        if response.status_code == 200 and complete and not no_store:
+            cache.store(key, response, ttl)
+    return response
+
+def read_body(response, max_bytes, on_chunk=None):
+    # Body max_bytes tak hi padhte hain; bada ho to baaki chhod dete hain
+    chunks = []
+    size = 0
+    response.truncated = False
+    response.stopped_early = False
+    for chunk in response.iter_content(chunk_size=64 * 1024):
+        if size + len(chunk) > max_bytes:
+            chunk = chunk[:max_bytes - size]
+            response.truncated = True
+        chunks.append(chunk)
+        size += len(chunk)
+        if on_chunk and on_chunk(chunk):
+            response.stopped_early = True
+            break
+        if response.truncated:
+            break
+
+    response._content = b''.join(chunks)
+    response._content_consumed = True
+    return response
+
+def feed_cached(response, on_chunk):
+    if on_chunk:
+        on_chunk(response.content)
+    return response
+
+def get_stats():
+    cache = get_response_cache()
+    hosts = {}
+    for adapter in set(get_session().adapters.values()):
+        pools = adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            host = hosts.setdefault(pool.host, {'requests': 0, 'connections': 0})
+            host['requests'] += pool.num_requests
+            host['connections'] += pool.num_connections
+
+    total_requests = sum(host['requests'] for host in hosts.values())
+    total_connections = sum(host['connections'] for host in hosts.values())
+    return {
+        'requests': total_requests,
+        'connections': total_connections,
+        'reused': max(0, total_requests - total_connections),
+        'truncated': _truncated,
+        'cache': dict(cache.stats) if cache else None,
+        'hosts': hosts,
+    }
@@ -0,0 +1,57 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    value TEXT,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_results_expires_at ON results(expires_at);
+"""
+
+# Lookup results (None bhi, yaani "kuch nahi mila") ka on-disk key -> value store, har entry ka apna TTL
+class ResultCache:
+    def __init__(self, path):
+        self.path = path
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.executescript(SCHEMA)
+        self.stats = {'hits': 0, 'misses': 0}
+
+    def get(self, key):
+        # (True, value) agar fresh entry hai, warna (False, None)
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT value FROM results WHERE key = ? AND expires_at > ?', (key, time.time())
+            ).fetchone()
+            self.stats['hits' if row else 'misses'] += 1
+        if row is None:
+            return False, None
+        return True, json.loads(row[0])
+
+    def set(self, key, value, ttl):
+        if ttl <= 0:
+            return
+        with self._lock, self._conn:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO results (key, value, expires_at) VALUES (?, ?, ?)',
+                (key, json.dumps(value), time.time() + ttl)
+            )
+
+    def purge(self):
+        with self._lock, self._conn:
+            return self._conn.execute('DELETE FROM results WHERE expires_at <= ?', (time.time(),)).rowcount
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
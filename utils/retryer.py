@@ -1,26 +1,38 @@
+import asyncio
 import time
 import functools
 from utils.logger import logger
-import yaml
-
-def load_config():
-    try:
-        with open('config.yml', 'r') as f:
-            return yaml.safe_load(f)
-    except Exception:
-        return {}
+from utils.config import get_config
 
 def get_max_retries():
-    config = load_config()
-    return config.get('scraping', {}).get('max_retries', 3)
+    return get_config().scraping.max_retries
 
 def retry(max_attempts=None, delay=1, exceptions=(Exception,)):
-    if max_attempts is None:
-        max_attempts = get_max_retries()
+    # max_attempts na diya ho to har call par config se (config.yml reload hone par naya value)
+    configured_attempts = max_attempts
     
     def decorator(func):
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                max_attempts = configured_attempts or get_max_retries()
+                attempts = 0
+                while attempts < max_attempts:
+                    try:
+                        return await func(*args, **kwargs)
+                    except exceptions as e:
+                        attempts += 1
+                        if attempts >= max_attempts:
+                            logger.error(f"Failed after {max_attempts} attempts: {str(e)}")
+                            raise
+                        logger.warning(f"Attempt {attempts}/{max_attempts} failed: {str(e)}. Retrying in {delay}s...")
+                        await asyncio.sleep(delay)
+                return None
+            return async_wrapper
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
+            max_attempts = configured_attempts or get_max_retries()
             attempts = 0
             while attempts < max_attempts:
                 try: